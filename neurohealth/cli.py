@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import argparse
 import json
-from uuid import uuid4
 
 from .config import Settings
+from .feedback import new_conversation_id
 from .models import ConversationTurn, NeuroHealthRequest, RecommendationFeedback, SymptomReport, UserProfile
 from .runtime import build_engine, parse_biometrics, parse_csv, parse_optional_int
 
+_EXIT_TOKENS = frozenset({"exit", "quit"})
+
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="NeuroHealth prototype CLI")
@@ -77,7 +79,7 @@ def _run_interactive(engine: NeuroHealthEngine, profile: UserProfile) -> None:
     history: list[ConversationTurn] = []
     while True:
         query = input("You: ").strip()
-        if query.lower() in {"exit", "quit"}:
+        if query.lower() in _EXIT_TOKENS:
             return
         if not query:
             print("Please enter a message.")
@@ -135,7 +137,7 @@ def main() -> None:
 
     if args.feedback_rating is not None:
         feedback = RecommendationFeedback(
-            conversation_id=str(uuid4()),
+            conversation_id=new_conversation_id(),
             rating=args.feedback_rating,
             comment=args.feedback_comment,
         )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -11,12 +12,11 @@ def _strip_optional_quotes(value: str) -> str:
     return value
 
 
-def _load_dotenv_defaults(path: str | Path = ".env") -> None:
-    env_path = Path(path)
-    if not env_path.exists():
-        return
-
-    for line in env_path.read_text(encoding="utf-8").splitlines():
+@lru_cache(maxsize=8)
+def _read_dotenv(path: str, mtime_ns: int, size: int) -> tuple[tuple[str, str], ...]:
+    # mtime_ns/size are only part of the cache key so edited files are re-read.
+    entries: list[tuple[str, str]] = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
         stripped = line.strip()
         if not stripped or stripped.startswith("#"):
             continue
@@ -29,10 +29,36 @@ def _load_dotenv_defaults(path: str | Path = ".env") -> None:
         env_key = key.strip()
         if not env_key:
             continue
-        env_value = _strip_optional_quotes(raw_value.strip())
+        entries.append((env_key, _strip_optional_quotes(raw_value.strip())))
+    return tuple(entries)
+
+
+def _load_dotenv_defaults(path: str | Path = ".env") -> None:
+    env_path = Path(path)
+    try:
+        stat = env_path.stat()
+    except FileNotFoundError:
+        return
+
+    for env_key, env_value in _read_dotenv(os.path.abspath(env_path), stat.st_mtime_ns, stat.st_size):
         os.environ.setdefault(env_key, env_value)
 
 
+_SETTINGS_ENV_KEYS = (
+    "GEMINI_API_KEY",
+    "GITHUB_TOKEN",
+    "GITHUB_MODELS_TOKEN",
+    "OPENAI_API_KEY",
+    "GEMINI_MODEL",
+    "GITHUB_EMBEDDING_MODEL",
+    "OPENAI_EMBEDDING_MODEL",
+    "GITHUB_MODELS_EMBEDDING_ENDPOINT",
+    "NEUROHEALTH_KB_PATH",
+    "NEUROHEALTH_FEEDBACK_PATH",
+    "NEUROHEALTH_EMBEDDING_CACHE_PATH",
+)
+
+
 @dataclass(frozen=True)
 class Settings:
     gemini_api_key: str
@@ -42,52 +68,68 @@ class Settings:
     embedding_endpoint: str = "https://models.github.ai/inference/embeddings"
     knowledge_base_path: str = "data/knowledge_base.json"
     feedback_store_path: str = "data/feedback.jsonl"
+    embedding_cache_path: str = "data/kb_embeddings.json"
 
     @classmethod
     def from_env(cls) -> "Settings":
         _load_dotenv_defaults(".env")
+        env_snapshot = tuple(os.environ.get(key) for key in _SETTINGS_ENV_KEYS)
+        return _settings_from_snapshot(cls, env_snapshot)
+
 
-        gemini_api_key = os.getenv("GEMINI_API_KEY", "").strip()
-        github_token = os.getenv(
-            "GITHUB_TOKEN",
-            os.getenv("GITHUB_MODELS_TOKEN", os.getenv("OPENAI_API_KEY", "")),
-        ).strip()
-        if not gemini_api_key:
-            raise ValueError("GEMINI_API_KEY is required (set env var or .env entry).")
-        if not github_token:
-            raise ValueError(
-                "GITHUB_TOKEN is required for GitHub Models embeddings (set env var or .env entry)."
-            )
-
-        gemini_model = os.getenv("GEMINI_MODEL", "gemini-2.0-flash").strip()
-        embedding_model = os.getenv(
-            "GITHUB_EMBEDDING_MODEL",
-            os.getenv("OPENAI_EMBEDDING_MODEL", "openai/text-embedding-3-small"),
-        ).strip()
-        embedding_endpoint = os.getenv(
-            "GITHUB_MODELS_EMBEDDING_ENDPOINT",
-            "https://models.github.ai/inference/embeddings",
-        ).strip()
-        kb_path = os.getenv("NEUROHEALTH_KB_PATH", "data/knowledge_base.json").strip()
-        feedback_path = os.getenv("NEUROHEALTH_FEEDBACK_PATH", "data/feedback.jsonl").strip()
-
-        if not gemini_model:
-            raise ValueError("GEMINI_MODEL must not be empty.")
-        if not embedding_model:
-            raise ValueError("GITHUB_EMBEDDING_MODEL must not be empty.")
-        if not embedding_endpoint:
-            raise ValueError("GITHUB_MODELS_EMBEDDING_ENDPOINT must not be empty.")
-        if not kb_path:
-            raise ValueError("NEUROHEALTH_KB_PATH must not be empty.")
-        if not feedback_path:
-            raise ValueError("NEUROHEALTH_FEEDBACK_PATH must not be empty.")
-
-        return cls(
-            gemini_api_key=gemini_api_key,
-            github_token=github_token,
-            gemini_model=gemini_model,
-            embedding_model=embedding_model,
-            embedding_endpoint=embedding_endpoint,
-            knowledge_base_path=kb_path,
-            feedback_store_path=feedback_path,
+@lru_cache(maxsize=8)
+def _settings_from_snapshot(cls: type[Settings], env_snapshot: tuple[str | None, ...]) -> Settings:
+    # Settings is frozen, so callers can safely share the cached instance.
+    env = {key: value for key, value in zip(_SETTINGS_ENV_KEYS, env_snapshot) if value is not None}
+
+    gemini_api_key = env.get("GEMINI_API_KEY", "").strip()
+    github_token = env.get(
+        "GITHUB_TOKEN",
+        env.get("GITHUB_MODELS_TOKEN", env.get("OPENAI_API_KEY", "")),
+    ).strip()
+    if not gemini_api_key:
+        raise ValueError("GEMINI_API_KEY is required (set env var or .env entry).")
+    if not github_token:
+        raise ValueError(
+            "GITHUB_TOKEN is required for GitHub Models embeddings (set env var or .env entry)."
         )
+
+    gemini_model = env.get("GEMINI_MODEL", "gemini-2.0-flash").strip()
+    embedding_model = env.get(
+        "GITHUB_EMBEDDING_MODEL",
+        env.get("OPENAI_EMBEDDING_MODEL", "openai/text-embedding-3-small"),
+    ).strip()
+    embedding_endpoint = env.get(
+        "GITHUB_MODELS_EMBEDDING_ENDPOINT",
+        "https://models.github.ai/inference/embeddings",
+    ).strip()
+    kb_path = env.get("NEUROHEALTH_KB_PATH", "data/knowledge_base.json").strip()
+    feedback_path = env.get("NEUROHEALTH_FEEDBACK_PATH", "data/feedback.jsonl").strip()
+    embedding_cache_path = env.get(
+        "NEUROHEALTH_EMBEDDING_CACHE_PATH",
+        "data/kb_embeddings.json",
+    ).strip()
+
+    if not gemini_model:
+        raise ValueError("GEMINI_MODEL must not be empty.")
+    if not embedding_model:
+        raise ValueError("GITHUB_EMBEDDING_MODEL must not be empty.")
+    if not embedding_endpoint:
+        raise ValueError("GITHUB_MODELS_EMBEDDING_ENDPOINT must not be empty.")
+    if not kb_path:
+        raise ValueError("NEUROHEALTH_KB_PATH must not be empty.")
+    if not feedback_path:
+        raise ValueError("NEUROHEALTH_FEEDBACK_PATH must not be empty.")
+    if not embedding_cache_path:
+        raise ValueError("NEUROHEALTH_EMBEDDING_CACHE_PATH must not be empty.")
+
+    return cls(
+        gemini_api_key=gemini_api_key,
+        github_token=github_token,
+        gemini_model=gemini_model,
+        embedding_model=embedding_model,
+        embedding_endpoint=embedding_endpoint,
+        knowledge_base_path=kb_path,
+        feedback_store_path=feedback_path,
+        embedding_cache_path=embedding_cache_path,
+    )
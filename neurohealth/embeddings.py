@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import json
+import threading
+from collections import OrderedDict
 from collections.abc import Callable
-from urllib import error, request
+from http.client import HTTPException
+
+from .transport import post_bytes
 
 JsonPostCallable = Callable[[str, dict[str, str], dict[str, object]], dict[str, object]]
 
@@ -14,19 +18,18 @@ class OpenAIEmbeddingError(RuntimeError):
 def _default_post_json(url: str, headers: dict[str, str], payload: dict[str, object]) -> dict[str, object]:
     body = json.dumps(payload).encode("utf-8")
     request_headers = {"Content-Type": "application/json", **headers}
-    req = request.Request(url=url, data=body, headers=request_headers, method="POST")
     try:
-        with request.urlopen(req, timeout=45) as response:
-            raw = response.read().decode("utf-8")
-    except error.HTTPError as exc:
-        detail = exc.read().decode("utf-8")
-        raise OpenAIEmbeddingError(f"Embedding request HTTP {exc.code}: {detail}") from exc
-    except error.URLError as exc:
-        raise OpenAIEmbeddingError(f"Embedding request network error: {exc.reason}") from exc
+        status, raw = post_bytes(url, request_headers, body, timeout=45)
+    except (OSError, HTTPException) as exc:
+        raise OpenAIEmbeddingError(f"Embedding request network error: {exc}") from exc
+    # post_bytes does not follow redirects, so a 3xx is an error here too.
+    if status >= 300:
+        detail = raw.decode("utf-8", errors="replace")
+        raise OpenAIEmbeddingError(f"Embedding request HTTP {status}: {detail}")
 
     try:
         parsed = json.loads(raw)
-    except json.JSONDecodeError as exc:
+    except ValueError as exc:
         raise OpenAIEmbeddingError("Embedding request returned invalid JSON.") from exc
 
     if not isinstance(parsed, dict):
@@ -41,6 +44,7 @@ class GitHubModelsEmbeddingClient:
         model: str = "openai/text-embedding-3-small",
         endpoint: str = "https://models.github.ai/inference/embeddings",
         post_json: JsonPostCallable | None = None,
+        query_cache_size: int = 512,
     ) -> None:
         if not api_key.strip():
             raise ValueError("Embedding API key/token must not be empty.")
@@ -56,6 +60,12 @@ class GitHubModelsEmbeddingClient:
         self._model = model
         self._endpoint = normalized_endpoint
         self._post_json = post_json or _default_post_json
+        # Repeated queries (interactive follow-ups, replayed inputs) skip the HTTPS
+        # round-trip. Vectors are cached as tuples so callers cannot mutate them;
+        # the least recently used entry is evicted once the cache is full.
+        self._query_cache: OrderedDict[str, tuple[float, ...]] = OrderedDict()
+        self._query_cache_size = query_cache_size
+        self._query_cache_lock = threading.Lock()
 
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         if not texts:
@@ -70,17 +80,42 @@ class GitHubModelsEmbeddingClient:
         if not isinstance(data, list) or len(data) != len(texts):
             raise OpenAIEmbeddingError("Embedding payload is missing expected vectors.")
 
-        indexed_items = sorted(data, key=lambda item: int(item.get("index", -1)))
-        vectors: list[list[float]] = []
-        for item in indexed_items:
+        # Indices are a permutation of 0..len(texts)-1, so place each vector
+        # directly instead of sorting. Items without an index keep their position.
+        vectors: list[list[float] | None] = [None] * len(texts)
+        for position, item in enumerate(data):
             embedding = item.get("embedding")
             if not isinstance(embedding, list):
                 raise OpenAIEmbeddingError("Embedding payload includes an invalid vector.")
-            vectors.append([float(value) for value in embedding])
-        return vectors
+            index = int(item.get("index", position))
+            if not 0 <= index < len(texts) or vectors[index] is not None:
+                raise OpenAIEmbeddingError("Embedding payload includes an invalid vector index.")
+            vectors[index] = list(map(float, embedding))
+        return vectors  # type: ignore[return-value]
 
     def embed_query(self, text: str) -> list[float]:
-        return self.embed_texts([text])[0]
+        return self.embed_queries([text])[0]
+
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        # embed_query() for several queries at once: cached queries are served from
+        # the cache and the distinct misses share one embed_texts() request.
+        found: dict[str, tuple[float, ...]] = {}
+        with self._query_cache_lock:
+            for text in texts:
+                vector = self._query_cache.get(text)
+                if vector is not None:
+                    self._query_cache.move_to_end(text)
+                    found[text] = vector
+        missing = [text for text in dict.fromkeys(texts) if text not in found]
+        if missing:
+            fresh = dict(zip(missing, map(tuple, self.embed_texts(missing))))
+            found.update(fresh)
+            if self._query_cache_size > 0:
+                with self._query_cache_lock:
+                    self._query_cache.update(fresh)
+                    while len(self._query_cache) > self._query_cache_size:
+                        self._query_cache.popitem(last=False)
+        return [list(found[text]) for text in texts]
 
 
 # Backward-compatible alias.
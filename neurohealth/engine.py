@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass
 from typing import Protocol
 
 from .feedback import FeedbackStore
 from .kb import EmbeddingClient, KnowledgeIndex
-from .models import NeuroHealthRequest, Recommendation, RecommendationFeedback
+from .models import NeuroHealthRequest, Recommendation, RecommendationFeedback, RetrievedChunk, UrgencyLevel
 from .prompts import build_reasoning_prompt, build_system_instruction
 from .safety import (
     appointment_for_urgency,
     assess_urgency,
     build_clarifying_questions,
     build_safety_instructions,
+    normalize_text,
 )
 
 
@@ -19,54 +24,138 @@ class LLMClient(Protocol):
         ...
 
 
+@dataclass(slots=True)
+class _Assessment:
+    urgency: UrgencyLevel
+    appointment: str
+    safety: tuple[str, ...]
+    clarifying_questions: list[str]
+    reasoning_notes: list[str]
+
+
 class NeuroHealthEngine:
     def __init__(
         self,
-        knowledge_index: KnowledgeIndex,
+        knowledge_index: KnowledgeIndex | Callable[[], KnowledgeIndex],
         embedding_client: EmbeddingClient,
         llm_client: LLMClient,
         feedback_store: FeedbackStore,
     ) -> None:
-        self._knowledge_index = knowledge_index
+        # A factory defers the (possibly network-bound) index build to the first
+        # request that actually needs retrieval.
+        if isinstance(knowledge_index, KnowledgeIndex):
+            self._knowledge_index: KnowledgeIndex | None = knowledge_index
+            self._knowledge_index_factory: Callable[[], KnowledgeIndex] = lambda: knowledge_index
+        else:
+            self._knowledge_index = None
+            self._knowledge_index_factory = knowledge_index
+        self._knowledge_index_lock = threading.Lock()
         self._embedding_client = embedding_client
         self._llm_client = llm_client
         self._feedback_store = feedback_store
 
-    def generate(self, request: NeuroHealthRequest) -> Recommendation:
-        urgency, triggers = assess_urgency(request.symptom_report, request.user_input)
-        appointment = appointment_for_urgency(urgency)
-        safety = build_safety_instructions(urgency)
-        clarifying_questions = build_clarifying_questions(request.symptom_report, request.user_input)
-        reasoning_notes = [f"urgency:{urgency}", *[f"trigger:{trigger}" for trigger in triggers]]
-
-        if urgency == "emergency":
-            emergency_message = (
-                "Your symptoms may indicate a medical emergency. "
-                "Please seek immediate emergency care now."
-            )
-            return Recommendation(
-                assistant_message=emergency_message,
-                urgency=urgency,
-                appointment_recommendation=appointment,
-                safety_instructions=safety,
-                sources=[],
-                reasoning_notes=reasoning_notes,
-                clarifying_questions=[],
-                needs_emergency=True,
-            )
+    @property
+    def embedding_client(self) -> EmbeddingClient:
+        return self._embedding_client
 
-        retrieved = self._knowledge_index.retrieve(
+    def generate(
+        self,
+        request: NeuroHealthRequest,
+        embedding_client: EmbeddingClient | None = None,
+    ) -> Recommendation:
+        # embedding_client overrides the engine's client for this request's query
+        # only (e.g. a wrapper that coalesces concurrent queries); emergencies
+        # return before any embedding or LLM call.
+        assessment = self._assess(request)
+        if assessment.urgency == "emergency":
+            return self._emergency_recommendation(assessment)
+
+        retrieved = self._get_knowledge_index().retrieve(
             query=request.user_input,
-            embedding_client=self._embedding_client,
+            embedding_client=embedding_client or self._embedding_client,
             top_k=4,
         )
+        return self._complete(request, assessment, retrieved)
+
+    def generate_batch(
+        self,
+        requests: Sequence[NeuroHealthRequest],
+        executor: Executor | None = None,
+    ) -> list[Recommendation]:
+        # Same results as calling generate() per request, but every query that
+        # needs retrieval is embedded in one embed_queries() call. LLM calls run
+        # through the executor when one is given, otherwise one after another.
+        assessments = [self._assess(request) for request in requests]
+        recommendations: dict[int, Recommendation] = {}
+        pending: list[int] = []
+        for position, assessment in enumerate(assessments):
+            if assessment.urgency == "emergency":
+                recommendations[position] = self._emergency_recommendation(assessment)
+            else:
+                pending.append(position)
+
+        if pending:
+            knowledge_index = self._get_knowledge_index()
+            query_vectors = self._embedding_client.embed_queries([requests[position].user_input for position in pending])
+            retrieved = [knowledge_index.search(query_vector, top_k=4) for query_vector in query_vectors]
+            completed = (executor.map if executor is not None else map)(
+                self._complete,
+                [requests[position] for position in pending],
+                [assessments[position] for position in pending],
+                retrieved,
+            )
+            for position, recommendation in zip(pending, completed):
+                recommendations[position] = recommendation
+        return [recommendations[position] for position in range(len(requests))]
+
+    def _assess(self, request: NeuroHealthRequest) -> _Assessment:
+        normalized_input = normalize_text(request.user_input)
+        urgency, triggers = assess_urgency(request.symptom_report, request.user_input, normalized_input)
+        clarifying_questions = build_clarifying_questions(
+            request.symptom_report,
+            request.user_input,
+            normalized_input,
+        )
+        reasoning_notes = [f"urgency:{urgency}"]
+        reasoning_notes.extend(f"trigger:{trigger}" for trigger in triggers)
+        return _Assessment(
+            urgency=urgency,
+            appointment=appointment_for_urgency(urgency),
+            safety=build_safety_instructions(urgency),
+            clarifying_questions=clarifying_questions,
+            reasoning_notes=reasoning_notes,
+        )
+
+    @staticmethod
+    def _emergency_recommendation(assessment: _Assessment) -> Recommendation:
+        emergency_message = (
+            "Your symptoms may indicate a medical emergency. "
+            "Please seek immediate emergency care now."
+        )
+        return Recommendation(
+            assistant_message=emergency_message,
+            urgency=assessment.urgency,
+            appointment_recommendation=assessment.appointment,
+            safety_instructions=list(assessment.safety),
+            sources=[],
+            reasoning_notes=assessment.reasoning_notes,
+            clarifying_questions=[],
+            needs_emergency=True,
+        )
+
+    def _complete(
+        self,
+        request: NeuroHealthRequest,
+        assessment: _Assessment,
+        retrieved: list[RetrievedChunk],
+    ) -> Recommendation:
         prompt = build_reasoning_prompt(
             request=request,
             retrieved_chunks=retrieved,
-            urgency=urgency,
-            appointment_recommendation=appointment,
-            safety_instructions=safety,
-            clarifying_questions=clarifying_questions,
+            urgency=assessment.urgency,
+            appointment_recommendation=assessment.appointment,
+            safety_instructions=assessment.safety,
+            clarifying_questions=assessment.clarifying_questions,
         )
         generated = self._llm_client.generate(
             prompt=prompt,
@@ -76,14 +165,23 @@ class NeuroHealthEngine:
         unique_sources = sorted({chunk.source for chunk in retrieved})
         return Recommendation(
             assistant_message=generated,
-            urgency=urgency,
-            appointment_recommendation=appointment,
-            safety_instructions=safety,
+            urgency=assessment.urgency,
+            appointment_recommendation=assessment.appointment,
+            safety_instructions=list(assessment.safety),
             sources=unique_sources,
-            reasoning_notes=reasoning_notes,
-            clarifying_questions=clarifying_questions,
+            reasoning_notes=assessment.reasoning_notes,
+            clarifying_questions=assessment.clarifying_questions,
             needs_emergency=False,
         )
 
+    def _get_knowledge_index(self) -> KnowledgeIndex:
+        knowledge_index = self._knowledge_index
+        if knowledge_index is None:
+            with self._knowledge_index_lock:
+                if self._knowledge_index is None:
+                    self._knowledge_index = self._knowledge_index_factory()
+                knowledge_index = self._knowledge_index
+        return knowledge_index
+
     def record_feedback(self, feedback: RecommendationFeedback) -> None:
         self._feedback_store.record(feedback)
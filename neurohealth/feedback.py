@@ -1,35 +1,106 @@
 from __future__ import annotations
 
+import itertools
 import json
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
 from dataclasses import asdict
 from pathlib import Path
+from typing import BinaryIO
 
 from .models import RecommendationFeedback
 
+_conversation_counter = itertools.count(1)
+_pid = os.getpid()
+
+
+def _refresh_pid() -> None:
+    global _pid
+    _pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    # A forked child must not reuse its parent's pid in ids.
+    os.register_at_fork(after_in_child=_refresh_pid)
+
+
+def new_conversation_id() -> str:
+    # Conversation ids only need to be unique, not unguessable: wall-clock
+    # milliseconds, the process id (cached, refreshed after fork), and a
+    # per-process counter avoid the os.urandom read behind uuid4(). next() on
+    # itertools.count is thread-safe.
+    return f"{time.time_ns() // 1_000_000:x}-{_pid:x}-{next(_conversation_counter):x}"
+
 
 class FeedbackStore:
     def __init__(self, path: str | Path) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One append handle is kept for the store's lifetime; the only saving is the
+        # open/close per record. Nothing is buffered across records: each write is
+        # flushed at once, so readers see it and a crash or SIGTERM cannot drop it.
+        self._handle: BinaryIO | None = None
+        self._lock = threading.Lock()
 
     def record(self, feedback: RecommendationFeedback) -> None:
-        payload = json.dumps(asdict(feedback), ensure_ascii=True)
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(payload + "\n")
+        payload = json.dumps(asdict(feedback), ensure_ascii=True).encode("ascii")
+        with self._lock:
+            handle = self._writer()
+            handle.write(payload + b"\n")
+            handle.flush()
+
+    def record_many(self, feedback: Iterable[RecommendationFeedback]) -> None:
+        # A burst is serialized up front and appended with one write, then flushed
+        # so the whole batch reaches the file together.
+        payload = b"".join(
+            [json.dumps(asdict(item), ensure_ascii=True).encode("ascii") + b"\n" for item in feedback]
+        )
+        if not payload:
+            return
+        with self._lock:
+            handle = self._writer()
+            handle.write(payload)
+            handle.flush()
+
+    def _writer(self) -> BinaryIO:
+        # Callers hold self._lock.
+        if self._handle is None:
+            self._handle = self.path.open("ab")
+        return self._handle
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def iter_raw(self) -> Iterator[dict[str, object]]:
+        self.flush()
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            return
+
+        # One read for the whole log keeps the decode loop tight instead of
+        # interleaving per-line buffered reads with parsing.
+        for line_number, line in enumerate(data.splitlines(), start=1):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            try:
+                payload = json.loads(stripped)
+            except ValueError as exc:
+                raise ValueError(f"Invalid feedback JSON at line {line_number}.") from exc
+            if not isinstance(payload, dict):
+                raise ValueError(f"Invalid feedback record at line {line_number}.")
+            yield payload
 
     def read_all(self) -> list[RecommendationFeedback]:
-        if not self.path.exists():
-            return []
-
-        records: list[RecommendationFeedback] = []
-        with self.path.open("r", encoding="utf-8") as handle:
-            for line_number, line in enumerate(handle, start=1):
-                stripped = line.strip()
-                if not stripped:
-                    continue
-                try:
-                    payload = json.loads(stripped)
-                except json.JSONDecodeError as exc:
-                    raise ValueError(f"Invalid feedback JSON at line {line_number}.") from exc
-                records.append(RecommendationFeedback(**payload))
-        return records
+        return [RecommendationFeedback(**payload) for payload in self.iter_raw()]
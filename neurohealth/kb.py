@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
 import json
 import math
+import os
+import sys
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass
+from operator import mul
 from pathlib import Path
 from typing import Protocol
 
@@ -16,24 +23,24 @@ class EmbeddingClient(Protocol):
     def embed_query(self, text: str) -> list[float]:
         ...
 
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        ...
+
 
-def _cosine_similarity(left: list[float], right: list[float]) -> float:
-    if len(left) != len(right):
-        raise ValueError("vector dimensions must match for cosine similarity.")
-    left_norm = math.sqrt(sum(value * value for value in left))
-    right_norm = math.sqrt(sum(value * value for value in right))
-    if left_norm == 0.0 or right_norm == 0.0:
-        return 0.0
-    dot = sum(a * b for a, b in zip(left, right))
-    return dot / (left_norm * right_norm)
+def _text_field(item: dict[str, object], key: str) -> str:
+    # JSON strings are already str; only coerce other scalar types.
+    value = item.get(key, "")
+    return (value if isinstance(value, str) else str(value)).strip()
 
 
 def load_knowledge_chunks(path: str | Path) -> list[KnowledgeChunk]:
     kb_path = Path(path)
-    if not kb_path.exists():
-        raise FileNotFoundError(f"Knowledge base file not found: {kb_path}")
+    try:
+        raw_bytes = kb_path.read_bytes()
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"Knowledge base file not found: {kb_path}") from exc
 
-    raw_data = json.loads(kb_path.read_text(encoding="utf-8"))
+    raw_data = json.loads(raw_bytes)
     if not isinstance(raw_data, list):
         raise ValueError("Knowledge base JSON must contain a list of chunk objects.")
 
@@ -42,14 +49,20 @@ def load_knowledge_chunks(path: str | Path) -> list[KnowledgeChunk]:
         if not isinstance(item, dict):
             raise ValueError(f"Knowledge chunk at index {index} is not an object.")
 
-        chunk_id = str(item.get("id", "")).strip()
-        title = str(item.get("title", "")).strip()
-        content = str(item.get("content", "")).strip()
-        source = str(item.get("source", "")).strip()
+        # Ids, sources, and tags repeat across chunks; interning lets them share one
+        # string object each and makes later set/dict lookups pointer comparisons.
+        chunk_id = sys.intern(_text_field(item, "id"))
+        title = _text_field(item, "title")
+        content = _text_field(item, "content")
+        source = sys.intern(_text_field(item, "source"))
         tags = item.get("tags", [])
         if not isinstance(tags, list):
             raise ValueError(f"Knowledge chunk {chunk_id or index} has invalid tags.")
-        normalized_tags = [str(tag).strip() for tag in tags if str(tag).strip()]
+        normalized_tags: list[str] = []
+        for tag in tags:
+            stripped_tag = (tag if isinstance(tag, str) else str(tag)).strip()
+            if stripped_tag:
+                normalized_tags.append(sys.intern(stripped_tag))
         if not chunk_id or not title or not content or not source:
             raise ValueError(f"Knowledge chunk {index} is missing required fields.")
 
@@ -68,18 +81,111 @@ def load_knowledge_chunks(path: str | Path) -> list[KnowledgeChunk]:
     return chunks
 
 
+def _embedding_cache_key(model: str, chunk: KnowledgeChunk) -> str:
+    material = f"{model}\0{chunk.id}\0{chunk.title}\0{chunk.content}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _load_embedding_cache(path: Path) -> dict[str, list[float]]:
+    # The cache is disposable: an unreadable or corrupt file, or any entry that is
+    # not a numeric vector of the recorded dimension, just means re-embedding.
+    try:
+        raw_data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw_data, dict):
+        return {}
+    dimension = raw_data.get("dimension")
+    vectors = raw_data.get("vectors")
+    if type(dimension) is not int or dimension <= 0 or not isinstance(vectors, dict):
+        return {}
+    return {
+        key: vector
+        for key, vector in vectors.items()
+        if isinstance(vector, list)
+        and len(vector) == dimension
+        and all(type(component) is float or type(component) is int for component in vector)
+    }
+
+
+def _save_embedding_cache(path: Path, entries: dict[str, list[float]]) -> None:
+    # Best effort: a read-only or full disk must not stop the index from building.
+    dimension = len(next(iter(entries.values()), []))
+    payload = {"dimension": dimension, "vectors": entries}
+    temp_path = path.with_name(path.name + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_bytes(json.dumps(payload, separators=(",", ":")).encode("ascii"))
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            temp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _unit_vector(vector: Sequence[float]) -> Sequence[float]:
+    norm = math.hypot(*vector)
+    if norm == 0.0:
+        return vector
+    return [value / norm for value in vector]
+
+
 @dataclass
 class KnowledgeIndex:
     chunks: list[KnowledgeChunk]
-    vectors: list[list[float]]
+    vectors: Sequence[Sequence[float]]
+
+    def __post_init__(self) -> None:
+        # Rows are stored L2-normalized as packed float32 arrays (4 bytes per
+        # dimension instead of a pointer plus a boxed float), so cosine similarity
+        # against a row is a single dot product scaled by the query norm.
+        self.vectors = [array("f", _unit_vector(vector)) for vector in self.vectors]
+        if len(self.vectors) != len(self.chunks):
+            raise ValueError("Knowledge vectors count does not match chunk count.")
+        dimensions = {len(vector) for vector in self.vectors}
+        if len(dimensions) > 1:
+            raise ValueError("Knowledge vectors must share the same dimension.")
 
     @classmethod
-    def build(cls, path: str | Path, embedding_client: EmbeddingClient) -> "KnowledgeIndex":
+    def build(
+        cls,
+        path: str | Path,
+        embedding_client: EmbeddingClient,
+        cache_path: str | Path | None = None,
+        embedding_model: str = "",
+    ) -> "KnowledgeIndex":
         chunks = load_knowledge_chunks(path)
-        texts = [f"{chunk.title}\n{chunk.content}" for chunk in chunks]
-        vectors = embedding_client.embed_texts(texts)
-        if len(vectors) != len(chunks):
-            raise ValueError("Knowledge vectors count does not match chunk count.")
+        if cache_path is None:
+            texts = [f"{chunk.title}\n{chunk.content}" for chunk in chunks]
+            return cls(chunks=chunks, vectors=embedding_client.embed_texts(texts))
+
+        def embed(indices: list[int]) -> list[list[float]]:
+            vectors = embedding_client.embed_texts([f"{chunks[index].title}\n{chunks[index].content}" for index in indices])
+            if len(vectors) != len(indices):
+                raise ValueError("Knowledge vectors count does not match chunk count.")
+            return vectors
+
+        cache_file = Path(cache_path)
+        keys = [_embedding_cache_key(embedding_model, chunk) for chunk in chunks]
+        loaded = _load_embedding_cache(cache_file)
+        cached = {key: loaded[key] for key in keys if key in loaded}
+        missing = [index for index, key in enumerate(keys) if key not in cached]
+        if missing:
+            fresh_vectors = embed(missing)
+            if cached and len(fresh_vectors[0]) != len(next(iter(cached.values()))):
+                # The model now returns a different dimension than the cached
+                # entries, so every cached entry is stale.
+                missing = list(range(len(chunks)))
+                fresh_vectors = embed(missing)
+            for index, vector in zip(missing, fresh_vectors):
+                cached[keys[index]] = vector
+
+        vectors = [cached[key] for key in keys]
+        if missing or loaded.keys() != set(keys):
+            # Only entries for the current chunks are kept, so edited or removed
+            # chunks do not accumulate in the cache file.
+            _save_embedding_cache(cache_file, dict(zip(keys, vectors)))
         return cls(chunks=chunks, vectors=vectors)
 
     def retrieve(
@@ -92,20 +198,20 @@ class KnowledgeIndex:
             raise ValueError("top_k must be > 0.")
         if not query.strip():
             raise ValueError("query must not be empty.")
+        return self.search(embedding_client.embed_query(query), top_k=top_k)
 
-        query_vector = embedding_client.embed_query(query)
-        scored: list[RetrievedChunk] = []
-        for chunk, vector in zip(self.chunks, self.vectors):
-            score = _cosine_similarity(query_vector, vector)
-            scored.append(
-                RetrievedChunk(
-                    id=chunk.id,
-                    title=chunk.title,
-                    content=chunk.content,
-                    source=chunk.source,
-                    tags=chunk.tags,
-                    score=score,
-                )
-            )
-        scored.sort(key=lambda item: item.score, reverse=True)
-        return scored[:top_k]
+    def search(self, query_vector: Sequence[float], top_k: int = 4) -> list[RetrievedChunk]:
+        if top_k <= 0:
+            raise ValueError("top_k must be > 0.")
+        if self.vectors and len(query_vector) != len(self.vectors[0]):
+            raise ValueError("vector dimensions must match for cosine similarity.")
+        query_norm = math.hypot(*query_vector)
+        if query_norm == 0.0:
+            scores = [0.0] * len(self.vectors)
+        else:
+            # Zero rows stay all-zero after normalization and score 0.0 here too.
+            scale = 1.0 / query_norm
+            scores = [sum(map(mul, query_vector, vector)) * scale for vector in self.vectors]
+
+        top_indices = heapq.nlargest(top_k, range(len(scores)), key=scores.__getitem__)
+        return [RetrievedChunk.from_chunk(self.chunks[index], scores[index]) for index in top_indices]
@@ -2,35 +2,35 @@ from __future__ import annotations
 
 import json
 from collections.abc import Callable
-from urllib import error, request
+from http.client import HTTPException
+
+from .transport import post_bytes
 
 JsonPostCallable = Callable[[str, dict[str, str], dict[str, object]], dict[str, object]]
 
 
+_GENERATION_CONFIG: dict[str, object] = {"temperature": 0.2, "topP": 0.9}
+
+
 class GeminiError(RuntimeError):
     """Raised when the Gemini API request fails."""
 
 
 def _default_post_json(url: str, headers: dict[str, str], payload: dict[str, object]) -> dict[str, object]:
     body = json.dumps(payload).encode("utf-8")
-    req = request.Request(
-        url=url,
-        data=body,
-        headers={"Content-Type": "application/json", **headers},
-        method="POST",
-    )
+    request_headers = {"Content-Type": "application/json", **headers}
     try:
-        with request.urlopen(req, timeout=60) as response:
-            raw = response.read().decode("utf-8")
-    except error.HTTPError as exc:
-        detail = exc.read().decode("utf-8")
-        raise GeminiError(f"Gemini HTTP {exc.code}: {detail}") from exc
-    except error.URLError as exc:
-        raise GeminiError(f"Gemini network error: {exc.reason}") from exc
+        status, raw = post_bytes(url, request_headers, body, timeout=60)
+    except (OSError, HTTPException) as exc:
+        raise GeminiError(f"Gemini network error: {exc}") from exc
+    # post_bytes does not follow redirects, so a 3xx is an error here too.
+    if status >= 300:
+        detail = raw.decode("utf-8", errors="replace")
+        raise GeminiError(f"Gemini HTTP {status}: {detail}")
 
     try:
         parsed = json.loads(raw)
-    except json.JSONDecodeError as exc:
+    except ValueError as exc:
         raise GeminiError("Gemini returned invalid JSON.") from exc
 
     if not isinstance(parsed, dict):
@@ -56,21 +56,21 @@ class GeminiClient:
         self._api_key = api_key
         self._model = model
         self._endpoint_template = endpoint_template
+        self._endpoint = endpoint_template.format(model=model, key=api_key)
         self._post_json = post_json or _default_post_json
 
     def generate(self, prompt: str, system_instruction: str | None = None) -> str:
         if not prompt.strip():
             raise ValueError("prompt must not be empty.")
 
-        endpoint = self._endpoint_template.format(model=self._model, key=self._api_key)
         payload: dict[str, object] = {
             "contents": [{"role": "user", "parts": [{"text": prompt}]}],
-            "generationConfig": {"temperature": 0.2, "topP": 0.9},
+            "generationConfig": _GENERATION_CONFIG,
         }
         if system_instruction:
             payload["system_instruction"] = {"parts": [{"text": system_instruction}]}
 
-        response = self._post_json(endpoint, {}, payload)
+        response = self._post_json(self._endpoint, {}, payload)
         candidates = response.get("candidates")
         if not isinstance(candidates, list) or not candidates:
             raise GeminiError("Gemini response did not include candidates.")
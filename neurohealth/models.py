@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import asdict, dataclass, field
 from typing import Literal
 
 UrgencyLevel = Literal["self_care", "routine", "urgent", "emergency"]
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     age: int | None = None
     preferences: list[str] = field(default_factory=list)
@@ -19,7 +20,7 @@ class UserProfile:
             raise ValueError("age must be a positive integer when provided.")
 
 
-@dataclass
+@dataclass(slots=True)
 class SymptomReport:
     symptoms: list[str] = field(default_factory=list)
     biometrics: dict[str, float | int | str] = field(default_factory=dict)
@@ -31,9 +32,13 @@ class SymptomReport:
             raise ValueError("duration_hours must be >= 0 when provided.")
         if self.pain_level is not None and not (0 <= self.pain_level <= 10):
             raise ValueError("pain_level must be in the [0, 10] range when provided.")
+        # Symptom names repeat across requests (form fields, CLI csv), so interned
+        # copies share one string object each. Values are kept as entered because
+        # they are echoed back into prompts.
+        self.symptoms = [sys.intern(symptom) if type(symptom) is str else symptom for symptom in self.symptoms]
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationTurn:
     role: Literal["user", "assistant"]
     content: str
@@ -45,7 +50,7 @@ class ConversationTurn:
             raise ValueError("content must not be empty.")
 
 
-@dataclass
+@dataclass(slots=True)
 class NeuroHealthRequest:
     user_input: str
     user_profile: UserProfile = field(default_factory=UserProfile)
@@ -57,7 +62,7 @@ class NeuroHealthRequest:
             raise ValueError("user_input must not be empty.")
 
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeChunk:
     id: str
     title: str
@@ -66,12 +71,17 @@ class KnowledgeChunk:
     tags: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievedChunk(KnowledgeChunk):
     score: float = 0.0
 
+    @classmethod
+    def from_chunk(cls, chunk: KnowledgeChunk, score: float) -> "RetrievedChunk":
+        # Shares the chunk's field objects (including the tags list) rather than copying.
+        return cls(chunk.id, chunk.title, chunk.content, chunk.source, chunk.tags, score)
 
-@dataclass
+
+@dataclass(slots=True)
 class Recommendation:
     assistant_message: str
     urgency: UrgencyLevel
@@ -86,7 +96,7 @@ class Recommendation:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class RecommendationFeedback:
     conversation_id: str
     rating: int
@@ -1,18 +1,65 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
+from collections.abc import Sequence
+from dataclasses import fields
+from functools import lru_cache
 
-from .models import NeuroHealthRequest, RetrievedChunk, UrgencyLevel
+from .models import ConversationTurn, NeuroHealthRequest, RetrievedChunk, UrgencyLevel
+
+
+# json.dumps(..., indent=2) builds a fresh JSONEncoder on every call; the prompt
+# sections share one configured encoder instead (same output).
+_PROMPT_JSON = json.JSONEncoder(indent=2)
+
+SYSTEM_INSTRUCTION = (
+    "You are NeuroHealth, a clinically cautious AI health assistant. "
+    "Ground recommendations in supplied medical snippets, adapt language to user literacy, "
+    "include nutrition and planning advice only when contextually relevant, and avoid definitive diagnoses. "
+    "Always prioritize patient safety and include explicit escalation cues."
+)
+
+# Static tail of the reasoning prompt, joined once at import.
+_RESPONSE_STRUCTURE = "\n".join(
+    [
+        "Produce a concise, user-friendly response with this structure:",
+        "1) Personalized guidance summary",
+        "2) Nutrition/planning advice relevant to profile + symptoms",
+        "3) Appointment recommendation with urgency rationale",
+        "4) Safety instructions and escalation cues",
+        "5) Optional clarifying questions (only if truly needed)",
+    ]
+)
+
+
+def _bullet_lines(items: Sequence[str], empty: str = "") -> str:
+    # One join with the bullet folded into the separator; no per-item formatting.
+    if not items:
+        return empty
+    return "- " + "\n- ".join(items)
+
+
+def _fields_dict(obj: object) -> dict[str, object]:
+    # Shallow stand-in for asdict(): the profile and symptom dataclasses hold only
+    # JSON-ready primitives, lists and dicts, so the recursive deep copy is wasted.
+    return {item.name: getattr(obj, item.name) for item in fields(obj)}
+
+
+@lru_cache(maxsize=1024)
+def _turn_json(role: str, content: str) -> str:
+    # A turn rendered as an element of the indented history array. Earlier turns
+    # repeat on every request of a session, so their encoding is reused.
+    return _PROMPT_JSON.encode({"role": role, "content": content}).replace("\n", "\n  ")
+
+
+def _history_json(history: Sequence[ConversationTurn]) -> str:
+    if not history:
+        return "[]"
+    return "[\n  " + ",\n  ".join([_turn_json(turn.role, turn.content) for turn in history]) + "\n]"
 
 
 def build_system_instruction() -> str:
-    return (
-        "You are NeuroHealth, a clinically cautious AI health assistant. "
-        "Ground recommendations in supplied medical snippets, adapt language to user literacy, "
-        "include nutrition and planning advice only when contextually relevant, and avoid definitive diagnoses. "
-        "Always prioritize patient safety and include explicit escalation cues."
-    )
+    return SYSTEM_INSTRUCTION
 
 
 def build_reasoning_prompt(
@@ -20,50 +67,47 @@ def build_reasoning_prompt(
     retrieved_chunks: list[RetrievedChunk],
     urgency: UrgencyLevel,
     appointment_recommendation: str,
-    safety_instructions: list[str],
+    safety_instructions: Sequence[str],
     clarifying_questions: list[str],
 ) -> str:
-    profile_json = json.dumps(asdict(request.user_profile), indent=2)
-    symptom_json = json.dumps(asdict(request.symptom_report), indent=2)
-    history_json = json.dumps([asdict(turn) for turn in request.history], indent=2)
+    profile_json = _PROMPT_JSON.encode(_fields_dict(request.user_profile))
+    symptom_json = _PROMPT_JSON.encode(_fields_dict(request.symptom_report))
+    history_json = _history_json(request.history)
     knowledge_context = "\n".join(
         [
             f"- [{chunk.source}] {chunk.title}: {chunk.content}"
             for chunk in retrieved_chunks
         ]
     )
-    clarifications = "\n".join([f"- {question}" for question in clarifying_questions]) or "- None"
-    safety_text = "\n".join([f"- {instruction}" for instruction in safety_instructions])
-
-    return f"""
-User profile:
-{profile_json}
-
-Symptom report:
-{symptom_json}
-
-Conversation history:
-{history_json}
-
-Latest user message:
-{request.user_input}
-
-Retrieved validated health knowledge:
-{knowledge_context}
+    clarifications = _bullet_lines(clarifying_questions, empty="- None")
+    safety_text = _bullet_lines(safety_instructions)
 
-Current urgency label: {urgency}
-Proposed appointment recommendation: {appointment_recommendation}
-
-Safety instructions to include:
-{safety_text}
-
-Clarifying questions to ask if needed:
-{clarifications}
-
-Produce a concise, user-friendly response with this structure:
-1) Personalized guidance summary
-2) Nutrition/planning advice relevant to profile + symptoms
-3) Appointment recommendation with urgency rationale
-4) Safety instructions and escalation cues
-5) Optional clarifying questions (only if truly needed)
-""".strip()
+    return "\n".join(
+        [
+            "User profile:",
+            profile_json,
+            "",
+            "Symptom report:",
+            symptom_json,
+            "",
+            "Conversation history:",
+            history_json,
+            "",
+            "Latest user message:",
+            request.user_input,
+            "",
+            "Retrieved validated health knowledge:",
+            knowledge_context,
+            "",
+            f"Current urgency label: {urgency}",
+            f"Proposed appointment recommendation: {appointment_recommendation}",
+            "",
+            "Safety instructions to include:",
+            safety_text,
+            "",
+            "Clarifying questions to ask if needed:",
+            clarifications,
+            "",
+            _RESPONSE_STRUCTURE,
+        ]
+    )
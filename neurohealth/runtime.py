@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache, partial
 from pathlib import Path
 
 from .config import Settings
@@ -11,58 +13,92 @@ from .llm import GeminiClient
 
 
 def parse_csv(value: str | None) -> list[str]:
-    if value is None:
+    if not value:
         return []
-    return [item.strip() for item in value.split(",") if item.strip()]
+    return [item for item in map(str.strip, value.split(",")) if item]
 
 
 def parse_optional_int(value: str | None) -> int | None:
-    if value is None:
-        return None
-    stripped = value.strip()
-    if not stripped:
-        return None
-    return int(stripped)
+    stripped = value.strip() if value else ""
+    return int(stripped) if stripped else None
+
+
+# One match splits key=value, trims both sides, and classifies the value, so
+# numeric parsing never relies on try/except control flow.
+_BIOMETRIC_PATTERN = re.compile(
+    r"\s*(?P<key>[^=]*?)\s*=\s*"
+    r"(?:(?P<float>[+-]?(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?)|(?P<int>[+-]?\d+)|(?P<text>.*?))\s*",
+    re.DOTALL,
+)
 
 
 def parse_biometrics(items: list[str]) -> dict[str, float | int | str]:
     biometrics: dict[str, float | int | str] = {}
     for item in items:
-        if "=" not in item:
+        # Fast path for the common unsigned-integer reading (heart_rate=89): the
+        # pattern would classify it the same way, so skip the regex engine.
+        key, separator, value = item.partition("=")
+        if separator:
+            metric = key.strip()
+            value = value.strip()
+            if metric and value.isdecimal():
+                biometrics[metric] = int(value)
+                continue
+
+        match = _BIOMETRIC_PATTERN.fullmatch(item)
+        if match is None:
             raise ValueError(f"Invalid biometric format '{item}'. Expected key=value.")
-        key, raw_value = item.split("=", 1)
-        metric = key.strip()
-        value = raw_value.strip()
+        metric = match["key"]
         if not metric:
             raise ValueError(f"Invalid biometric key in '{item}'.")
-        if not value:
-            raise ValueError(f"Invalid biometric value in '{item}'.")
 
-        if "." in value:
-            try:
-                biometrics[metric] = float(value)
-                continue
-            except ValueError:
-                pass
-        try:
-            biometrics[metric] = int(value)
-            continue
-        except ValueError:
-            biometrics[metric] = value
+        if match["float"] is not None:
+            biometrics[metric] = float(match["float"])
+        elif match["int"] is not None:
+            biometrics[metric] = int(match["int"])
+        elif match["text"]:
+            biometrics[metric] = match["text"]
+        else:
+            raise ValueError(f"Invalid biometric value in '{item}'.")
     return biometrics
 
 
-def build_engine(settings: Settings) -> NeuroHealthEngine:
-    embedding_client = GitHubModelsEmbeddingClient(
+def _build_embedding_client(settings: Settings) -> GitHubModelsEmbeddingClient:
+    return GitHubModelsEmbeddingClient(
         api_key=settings.github_token,
         model=settings.embedding_model,
         endpoint=settings.embedding_endpoint,
     )
-    knowledge_index = KnowledgeIndex.build(Path(settings.knowledge_base_path), embedding_client)
+
+
+@lru_cache(maxsize=4)
+def _cached_knowledge_index(settings: Settings, knowledge_base_mtime_ns: int) -> KnowledgeIndex:
+    # The mtime is part of the key so an edited knowledge base is rebuilt.
+    return KnowledgeIndex.build(
+        Path(settings.knowledge_base_path),
+        _build_embedding_client(settings),
+        cache_path=Path(settings.embedding_cache_path),
+        embedding_model=settings.embedding_model,
+    )
+
+
+def _load_knowledge_index(settings: Settings) -> KnowledgeIndex:
+    # Engines built in the same process with the same settings share one index.
+    try:
+        mtime_ns = Path(settings.knowledge_base_path).stat().st_mtime_ns
+    except OSError:
+        # Let KnowledgeIndex.build report the missing file; failures are not cached.
+        mtime_ns = -1
+    return _cached_knowledge_index(settings, mtime_ns)
+
+
+def build_engine(settings: Settings) -> NeuroHealthEngine:
+    embedding_client = _build_embedding_client(settings)
+    knowledge_index_factory = partial(_load_knowledge_index, settings)
     llm_client = GeminiClient(api_key=settings.gemini_api_key, model=settings.gemini_model)
     feedback_store = FeedbackStore(Path(settings.feedback_store_path))
     return NeuroHealthEngine(
-        knowledge_index=knowledge_index,
+        knowledge_index=knowledge_index_factory,
         embedding_client=embedding_client,
         llm_client=llm_client,
         feedback_store=feedback_store,
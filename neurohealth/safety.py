@@ -1,131 +1,206 @@
 from __future__ import annotations
 
+import re
+import sys
+from collections.abc import Callable, Iterable
+from typing import Any
+
 from .models import SymptomReport, UrgencyLevel
 
-EMERGENCY_KEYWORDS = {
+# Ordered roughly by how often each red flag shows up, so the scanner tries the
+# most likely phrase first at every position.
+EMERGENCY_KEYWORDS: tuple[str, ...] = (
     "chest pain",
     "shortness of breath",
-    "severe bleeding",
+    "seizure",
     "stroke",
-    "one-sided weakness",
-    "slurred speech",
     "loss of consciousness",
-    "suicidal",
+    "severe bleeding",
+    "slurred speech",
+    "one-sided weakness",
     "anaphylaxis",
-    "seizure",
-}
+    "suicidal",
+)
 
-URGENT_KEYWORDS = {
+URGENT_KEYWORDS: tuple[str, ...] = (
     "high fever",
-    "persistent vomiting",
     "dehydration",
-    "wheezing",
-    "rapid heartbeat",
+    "persistent vomiting",
     "severe headache",
     "infection",
+    "wheezing",
+    "rapid heartbeat",
     "painful urination",
+)
+
+
+def _compile_keyword_scanner(keywords: Iterable[str]) -> re.Pattern[str]:
+    # A zero-width lookahead reports every keyword start, including overlapping
+    # matches, so one scan keeps the semantics of a `keyword in text` check per
+    # keyword. Priority order is kept, except that a keyword which prefixes a
+    # longer one is moved after it so the longer phrase is not shadowed.
+    ordered = list(keywords)
+    ordered.sort(key=lambda keyword: any(other != keyword and other.startswith(keyword) for other in ordered))
+    alternatives = "|".join(re.escape(keyword) for keyword in ordered)
+    return re.compile(f"(?=({alternatives}))")
+
+
+# sys.intern registers the keyword literals themselves, so the tuples above and
+# this table share interned string objects with interned symptom text.
+_KEYWORD_LEVELS: dict[str, UrgencyLevel] = {
+    **dict.fromkeys(map(sys.intern, EMERGENCY_KEYWORDS), "emergency"),
+    **{sys.intern(keyword): "urgent" for keyword in URGENT_KEYWORDS if keyword not in EMERGENCY_KEYWORDS},
 }
+_KEYWORD_SCANNER = _compile_keyword_scanner(_KEYWORD_LEVELS)
+_EMERGENCY_SCANNER = _compile_keyword_scanner(EMERGENCY_KEYWORDS)
+_CLARIFY_SCANNER = re.compile("pain|fever|cough|shortness of breath")
 
 
-def _normalize(text: str) -> str:
+def normalize_text(text: str) -> str:
     return " ".join(text.lower().split())
 
 
+def _numeric_from_text(value: str) -> float | None:
+    normalized = value.strip()
+    if not normalized:
+        return None
+    return float(normalized)
+
+
+# Readers keyed by exact type: one dict lookup instead of an isinstance chain for
+# the values parse_biometrics produces.
+_NUMERIC_READERS: dict[type, Callable[[Any], float | None]] = {
+    float: float,
+    int: float,
+    bool: float,
+    str: _numeric_from_text,
+}
+
+
 def _extract_numeric(biometrics: dict[str, float | int | str], key: str) -> float | None:
     value = biometrics.get(key)
-    if value is None:
-        return None
+    reader = _NUMERIC_READERS.get(type(value))
+    if reader is not None:
+        return reader(value)
+    # Subclasses of the supported types take the slow path.
     if isinstance(value, (int, float)):
         return float(value)
     if isinstance(value, str):
-        normalized = value.strip()
-        if not normalized:
-            return None
-        return float(normalized)
+        return _numeric_from_text(value)
     return None
 
 
-def assess_urgency(report: SymptomReport, user_input: str) -> tuple[UrgencyLevel, list[str]]:
-    combined = _normalize(" ".join([user_input, *report.symptoms]))
-    triggers: list[str] = []
+def assess_urgency(
+    report: SymptomReport,
+    user_input: str,
+    normalized_input: str | None = None,
+) -> tuple[UrgencyLevel, tuple[str, ...]]:
+    # Callers that already normalized user_input (see normalize_text) can pass it
+    # in to avoid a second lower/split/join pass over the message.
+    if normalized_input is None:
+        normalized_input = normalize_text(user_input)
+    # Symptoms are read on every call: the report is mutable, so a cached copy
+    # could miss red flags added after construction.
+    normalized_symptoms = normalize_text(" ".join(report.symptoms))
+    combined = " ".join(part for part in (normalized_input, normalized_symptoms) if part)
+
+    emergency_hits: dict[str, None] = {}
+    urgent_hits: dict[str, None] = {}
+    for match in _KEYWORD_SCANNER.finditer(combined):
+        keyword = match.group(1)
+        if _KEYWORD_LEVELS[keyword] == "emergency":
+            # Emergency outranks every other signal: stop tracking urgent hits and
+            # finish with the emergency-only scanner for the trigger audit trail.
+            emergency_hits[keyword] = None
+            emergency_hits.update(dict.fromkeys(_EMERGENCY_SCANNER.findall(combined, match.start() + 1)))
+            break
+        urgent_hits[keyword] = None
 
-    emergency_hits = [keyword for keyword in EMERGENCY_KEYWORDS if keyword in combined]
     if emergency_hits:
-        triggers.extend([f"keyword:{keyword}" for keyword in emergency_hits])
-        return "emergency", triggers
+        return "emergency", tuple([f"keyword:{keyword}" for keyword in emergency_hits])
 
     oxygen_saturation = _extract_numeric(report.biometrics, "oxygen_saturation")
     if oxygen_saturation is not None and oxygen_saturation < 92.0:
-        triggers.append("biometric:low_oxygen_saturation")
-        return "emergency", triggers
+        return "emergency", ("biometric:low_oxygen_saturation",)
 
     temperature_c = _extract_numeric(report.biometrics, "temperature_c")
     if temperature_c is not None and temperature_c >= 39.0:
-        triggers.append("biometric:high_fever")
-        return "urgent", triggers
+        return "urgent", ("biometric:high_fever",)
 
     if report.pain_level is not None and report.pain_level >= 7:
-        triggers.append("pain_level:>=7")
-        return "urgent", triggers
+        return "urgent", ("pain_level:>=7",)
 
-    urgent_hits = [keyword for keyword in URGENT_KEYWORDS if keyword in combined]
     if urgent_hits:
-        triggers.extend([f"keyword:{keyword}" for keyword in urgent_hits])
-        return "urgent", triggers
+        return "urgent", tuple([f"keyword:{keyword}" for keyword in urgent_hits])
 
     if report.symptoms or user_input.strip():
-        triggers.append("symptoms_present")
-        return "routine", triggers
+        return "routine", ("symptoms_present",)
 
-    return "self_care", ["no_risk_signal"]
+    return "self_care", ("no_risk_signal",)
+
+
+_SELF_CARE_APPOINTMENT = "Self-care is reasonable; monitor symptoms and schedule routine care if symptoms persist."
+_APPOINTMENTS: dict[str, str] = {
+    "emergency": "Go to the nearest emergency department now or call local emergency services.",
+    "urgent": "Book a same-day urgent care or telemedicine appointment.",
+    "routine": "Schedule a primary care appointment within 2-7 days.",
+    "self_care": _SELF_CARE_APPOINTMENT,
+}
+
+_BASE_SAFETY = (
+    "This assistant provides educational guidance and does not replace professional medical diagnosis.",
+)
+_SELF_CARE_SAFETY = _BASE_SAFETY + (
+    "Continue monitoring symptoms and hydration/rest routines.",
+    "Seek medical care if symptoms worsen or fail to improve.",
+)
+_SAFETY_INSTRUCTIONS: dict[str, tuple[str, ...]] = {
+    "emergency": _BASE_SAFETY
+    + (
+        "Seek emergency care immediately.",
+        "Do not delay care while waiting for additional online advice.",
+    ),
+    "urgent": _BASE_SAFETY
+    + (
+        "Seek same-day clinical evaluation.",
+        "Escalate to emergency care if breathing, consciousness, or severe pain worsens.",
+    ),
+    "routine": _BASE_SAFETY
+    + (
+        "Track symptom progression and schedule a clinician follow-up.",
+        "Escalate care if red-flag symptoms emerge.",
+    ),
+    "self_care": _SELF_CARE_SAFETY,
+}
 
 
 def appointment_for_urgency(urgency: UrgencyLevel) -> str:
-    if urgency == "emergency":
-        return "Go to the nearest emergency department now or call local emergency services."
-    if urgency == "urgent":
-        return "Book a same-day urgent care or telemedicine appointment."
-    if urgency == "routine":
-        return "Schedule a primary care appointment within 2-7 days."
-    return "Self-care is reasonable; monitor symptoms and schedule routine care if symptoms persist."
-
-
-def build_safety_instructions(urgency: UrgencyLevel) -> list[str]:
-    base = [
-        "This assistant provides educational guidance and does not replace professional medical diagnosis.",
-    ]
-    if urgency == "emergency":
-        return base + [
-            "Seek emergency care immediately.",
-            "Do not delay care while waiting for additional online advice.",
-        ]
-    if urgency == "urgent":
-        return base + [
-            "Seek same-day clinical evaluation.",
-            "Escalate to emergency care if breathing, consciousness, or severe pain worsens.",
-        ]
-    if urgency == "routine":
-        return base + [
-            "Track symptom progression and schedule a clinician follow-up.",
-            "Escalate care if red-flag symptoms emerge.",
-        ]
-    return base + [
-        "Continue monitoring symptoms and hydration/rest routines.",
-        "Seek medical care if symptoms worsen or fail to improve.",
-    ]
-
-
-def build_clarifying_questions(report: SymptomReport, user_input: str) -> list[str]:
+    return _APPOINTMENTS.get(urgency, _SELF_CARE_APPOINTMENT)
+
+
+def build_safety_instructions(urgency: UrgencyLevel) -> tuple[str, ...]:
+    # The shared, immutable table entry; callers copy it if they need a list.
+    return _SAFETY_INSTRUCTIONS.get(urgency, _SELF_CARE_SAFETY)
+
+
+def build_clarifying_questions(
+    report: SymptomReport,
+    user_input: str,
+    normalized_input: str | None = None,
+) -> list[str]:
     questions: list[str] = []
-    normalized_input = _normalize(user_input)
+    if normalized_input is None:
+        normalized_input = normalize_text(user_input)
 
     if report.duration_hours is None:
         questions.append("How long have these symptoms been present?")
-    if report.pain_level is None and "pain" in normalized_input:
+    # None of these terms overlaps another, so one findall pass sees them all.
+    mentioned = set(_CLARIFY_SCANNER.findall(normalized_input))
+    if report.pain_level is None and "pain" in mentioned:
         questions.append("On a 0-10 scale, what is your pain level right now?")
-    if "fever" in normalized_input and "temperature_c" not in report.biometrics:
+    if "fever" in mentioned and "temperature_c" not in report.biometrics:
         questions.append("Do you have a measured temperature in Celsius?")
-    if "cough" in normalized_input and "shortness of breath" not in normalized_input:
+    if "cough" in mentioned and "shortness of breath" not in mentioned:
         questions.append("Is the cough dry or productive, and is breathing comfortable at rest?")
 
     return questions[:3]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import http.client
+import select
+import sys
+import threading
+from urllib import error, request
+from urllib.parse import urlsplit
+
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+# http.client sends no User-Agent of its own (urllib used "Python-urllib/X.Y").
+_USER_AGENT = f"neurohealth Python-http.client/{sys.version_info[0]}.{sys.version_info[1]}"
+
+_local = threading.local()
+
+
+def _connections() -> dict[tuple[str, str, float], http.client.HTTPConnection]:
+    pool = getattr(_local, "connections", None)
+    if pool is None:
+        pool = {}
+        _local.connections = pool
+    return pool
+
+
+def _was_dropped(connection: http.client.HTTPConnection) -> bool:
+    # An idle keep-alive socket is only readable if the server closed it (EOF) or
+    # sent something unsolicited; either way it cannot carry another request.
+    sock = connection.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _open_connection(scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+    if scheme == "https":
+        return http.client.HTTPSConnection(netloc, timeout=timeout)
+    if scheme == "http":
+        return http.client.HTTPConnection(netloc, timeout=timeout)
+    raise ValueError(f"Unsupported URL scheme '{scheme}'.")
+
+
+def _post_via_urllib(
+    url: str,
+    headers: dict[str, str],
+    body: bytes,
+    timeout: float,
+) -> tuple[int, bytes]:
+    req = request.Request(url=url, data=body, headers=headers, method="POST")
+    try:
+        with request.urlopen(req, timeout=timeout) as response:
+            return response.status, response.read()
+    except error.HTTPError as exc:
+        return exc.code, exc.read()
+
+
+def post_bytes(
+    url: str,
+    headers: dict[str, str],
+    body: bytes,
+    timeout: float,
+) -> tuple[int, bytes]:
+    # Connections are kept alive per thread and host so repeated API calls reuse
+    # one TCP/TLS session. Network failures surface as OSError/HTTPException.
+    # Redirects are not followed: a 3xx is returned like any other status (the
+    # JSON APIs behind this never redirect a POST, and urllib would have replayed
+    # it as a GET without the body).
+    if not any(name.lower() == "user-agent" for name in headers):
+        headers = {"User-Agent": _USER_AGENT, **headers}
+    parts = urlsplit(url)
+    if request.getproxies().get(parts.scheme) and not request.proxy_bypass(parts.hostname or ""):
+        # http.client does not speak to proxies; keep urllib's proxy handling.
+        return _post_via_urllib(url, headers, body, timeout)
+
+    target = parts.path or "/"
+    if parts.query:
+        target = f"{target}?{parts.query}"
+
+    pool = _connections()
+    key = (parts.scheme, parts.netloc, timeout)
+    connection = pool.pop(key, None)
+    if connection is not None and _was_dropped(connection):
+        connection.close()
+        connection = None
+    reused = connection is not None
+    while True:
+        if connection is None:
+            connection = _open_connection(parts.scheme, parts.netloc, timeout)
+        try:
+            connection.request("POST", target, body=body, headers=headers)
+        except _STALE_CONNECTION_ERRORS:
+            connection.close()
+            if not reused:
+                raise
+            # The kept-alive socket died before the request went out, so the
+            # server cannot have seen it; retry once on a fresh connection.
+            connection = None
+            reused = False
+            continue
+        except BaseException:
+            connection.close()
+            raise
+        break
+
+    # Once the request has been sent it is never replayed: the server may already
+    # have acted on it (and billed for it) even if the response is lost.
+    try:
+        response = connection.getresponse()
+        payload = response.read()
+    except BaseException:
+        connection.close()
+        raise
+
+    if response.will_close:
+        connection.close()
+    else:
+        pool[key] = connection
+    return response.status, payload
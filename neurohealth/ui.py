@@ -1,20 +1,36 @@
 from __future__ import annotations
 
-import argparse
+import hashlib
 import html
 import json
+import os
+import queue
+import select
+import threading
+import time
+from concurrent.futures import Future
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Callable, Literal
-from urllib.parse import parse_qs
-from uuid import uuid4
+from typing import TYPE_CHECKING, BinaryIO, Callable, Literal
+from urllib.parse import unquote_plus
 
 from .config import Settings
 from .engine import NeuroHealthEngine
-from .models import NeuroHealthRequest, Recommendation, RecommendationFeedback, SymptomReport, UserProfile
+from .feedback import new_conversation_id
+from .kb import EmbeddingClient
+from .models import (
+    NeuroHealthRequest,
+    Recommendation,
+    RecommendationFeedback,
+    SymptomReport,
+    UserProfile,
+)
 from .runtime import build_engine, parse_biometrics, parse_csv, parse_optional_int
 
+if TYPE_CHECKING:
+    import argparse
+
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DIAGRAM_PATH = REPO_ROOT / "assets" / "Diagram.png"
 LEGACY_DIAGRAM_PATH = REPO_ROOT / "ProjectDescription" / "Diagram.png"
@@ -28,29 +44,42 @@ def _value(form: dict[str, str], key: str, default: str = "") -> str:
     return form.get(key, default)
 
 
-def _selected(current: str, expected: str) -> str:
-    return " selected" if current == expected else ""
+# `selected` attributes for the basic / intermediate / advanced literacy options.
+_HEALTH_LITERACY_SELECTED: dict[str, tuple[str, str, str]] = {
+    "basic": (" selected", "", ""),
+    "intermediate": ("", " selected", ""),
+    "advanced": ("", "", " selected"),
+}
+_NONE_SELECTED = ("", "", "")
 
 
 def _list_items(values: list[str], empty_label: str) -> str:
-    return "".join(f"<li>{_escape(value)}</li>" for value in values) or f"<li>{_escape(empty_label)}</li>"
+    # Tags are folded into the join separator, so each item costs one escape call.
+    if not values:
+        return f"<li>{_escape(empty_label)}</li>"
+    return "<li>" + "</li><li>".join(map(_escape, values)) + "</li>"
 
 
 def _source_chips(values: list[str]) -> str:
-    return "".join(f'<span class="chip">{_escape(value)}</span>' for value in values) or '<span class="chip muted">No source cited</span>'
+    if not values:
+        return '<span class="chip muted">No source cited</span>'
+    return '<span class="chip">' + '</span><span class="chip">'.join(map(_escape, values)) + "</span>"
+
+
+_URGENCY_BADGE_CLASSES = {
+    "self_care": "urgency-self-care",
+    "routine": "urgency-routine",
+    "urgent": "urgency-urgent",
+    "emergency": "urgency-emergency",
+}
 
 
 def _urgency_badge_class(urgency: str) -> str:
-    mapping = {
-        "self_care": "urgency-self-care",
-        "routine": "urgency-routine",
-        "urgent": "urgency-urgent",
-        "emergency": "urgency-emergency",
-    }
-    return mapping.get(urgency, "urgency-routine")
+    return _URGENCY_BADGE_CLASSES.get(urgency, "urgency-routine")
 
 
-def _render_recommendation(recommendation: Recommendation, user_query: str) -> str:
+def _render_recommendation(recommendation: Recommendation, escaped_query: str) -> str:
+    # escaped_query is already HTML-escaped by _render_page, which shows it in the form too.
     safety_html = _list_items(recommendation.safety_instructions, "No safety instructions provided.")
     clarifications_html = _list_items(recommendation.clarifying_questions, "No follow-up question needed.")
     reasoning_html = _list_items(recommendation.reasoning_notes, "No reasoning notes captured.")
@@ -72,7 +101,7 @@ def _render_recommendation(recommendation: Recommendation, user_query: str) -> s
   <div class="conversation">
     <div class="bubble bubble-user">
       <p class="bubble-title">You</p>
-      <p>{_escape(user_query)}</p>
+      <p>{escaped_query}</p>
     </div>
     <div class="bubble bubble-assistant">
       <p class="bubble-title">NeuroHealth</p>
@@ -105,360 +134,353 @@ def _render_recommendation(recommendation: Recommendation, user_query: str) -> s
 """.strip()
 
 
-def _render_page(form: dict[str, str], result: Recommendation | None = None, error: str = "") -> str:
-    query_value = _value(form, "query")
-    result_html = _render_recommendation(result, query_value) if result else """
-<section class="result-shell empty-state">
-  <h2>Clinical Guidance Output</h2>
-  <p>Your recommendation appears here after submitting the intake form.</p>
-  <div class="placeholder-grid">
-    <div class="placeholder-card"><strong>Urgency assessment</strong><span>self-care / routine / urgent / emergency</span></div>
-    <div class="placeholder-card"><strong>Appointment routing</strong><span>primary care, same-day care, or emergency escalation</span></div>
-    <div class="placeholder-card"><strong>Safety guidance</strong><span>red-flag instructions and escalation cues</span></div>
-    <div class="placeholder-card"><strong>Knowledge grounding</strong><span>evidence snippets from validated sources</span></div>
-  </div>
-</section>
-""".strip()
-    error_html = f'<div class="error-banner">{_escape(error)}</div>' if error else ""
-
-    return f"""<!doctype html>
+# The stylesheet is served separately from /static/app.css. Its URL embeds a
+# content hash, so browsers may cache it indefinitely and pick up edits at once.
+_STYLESHEET = """:root {
+  --bg-1: #f3f7ff;
+  --bg-2: #eefaf5;
+  --panel: #ffffff;
+  --text: #10213a;
+  --muted: #5c6b80;
+  --primary: #2962ff;
+  --primary-soft: #e8eeff;
+  --success: #1e8e3e;
+  --warning: #d97a00;
+  --danger: #c62828;
+  --shadow: 0 14px 40px rgba(16, 33, 58, 0.12);
+  --radius-lg: 18px;
+  --radius-md: 12px;
+}
+* { box-sizing: border-box; }
+body {
+  margin: 0;
+  font-family: "Inter", "Segoe UI", Arial, sans-serif;
+  color: var(--text);
+  background:
+    radial-gradient(1200px 600px at 10% -10%, #dfe9ff, transparent 60%),
+    radial-gradient(1000px 500px at 90% -10%, #dcf5e8, transparent 60%),
+    linear-gradient(180deg, var(--bg-1), var(--bg-2));
+}
+.page {
+  max-width: 1220px;
+  margin: 0 auto;
+  padding: 28px 18px 36px;
+}
+.hero {
+  background: linear-gradient(120deg, #10213a 0%, #193766 40%, #2550a6 100%);
+  color: #f5f8ff;
+  border-radius: 22px;
+  padding: 24px 24px 18px;
+  box-shadow: var(--shadow);
+  margin-bottom: 16px;
+}
+.hero h1 {
+  margin: 0 0 10px;
+  font-size: 1.95rem;
+  letter-spacing: 0.2px;
+}
+.hero p {
+  margin: 0;
+  color: #d8e5ff;
+  line-height: 1.5;
+  max-width: 920px;
+}
+.workflow {
+  background: var(--panel);
+  border-radius: var(--radius-lg);
+  box-shadow: var(--shadow);
+  padding: 18px;
+  margin-bottom: 16px;
+}
+.workflow h2 {
+  margin: 0 0 12px;
+  font-size: 1.15rem;
+}
+.workflow-grid {
+  display: grid;
+  grid-template-columns: repeat(5, minmax(0, 1fr));
+  gap: 10px;
+}
+.workflow-step {
+  background: linear-gradient(180deg, #f8fbff, #f0f5ff);
+  border: 1px solid #d8e3ff;
+  border-radius: var(--radius-md);
+  padding: 10px 10px 12px;
+}
+.workflow-step strong {
+  display: block;
+  font-size: 0.84rem;
+  margin-bottom: 4px;
+  color: #16345f;
+}
+.workflow-step span {
+  color: #5a6b84;
+  font-size: 0.8rem;
+  line-height: 1.35;
+}
+.diagram-panel {
+  background: var(--panel);
+  border-radius: var(--radius-lg);
+  box-shadow: var(--shadow);
+  padding: 18px;
+  margin-bottom: 16px;
+}
+.diagram-panel h2 {
+  margin: 0 0 10px;
+  font-size: 1.1rem;
+}
+.diagram-panel p {
+  margin: 0 0 12px;
+  color: var(--muted);
+  font-size: 0.92rem;
+}
+.diagram-image {
+  width: 100%;
+  max-height: 360px;
+  object-fit: contain;
+  background: #f7faff;
+  border-radius: var(--radius-md);
+  border: 1px solid #dbe7ff;
+}
+.error-banner {
+  background: #ffe8e8;
+  border: 1px solid #ffbbbb;
+  color: #7f1d1d;
+  border-radius: 10px;
+  padding: 10px 12px;
+  margin-bottom: 14px;
+  font-weight: 600;
+}
+.layout {
+  display: grid;
+  grid-template-columns: minmax(320px, 1fr) minmax(380px, 1.15fr);
+  gap: 16px;
+  align-items: start;
+}
+.panel {
+  background: var(--panel);
+  border-radius: var(--radius-lg);
+  box-shadow: var(--shadow);
+  padding: 18px;
+}
+.panel h2 {
+  margin: 0 0 12px;
+  font-size: 1.2rem;
+}
+.panel h3 {
+  margin: 0 0 8px;
+  font-size: 0.98rem;
+}
+.muted {
+  color: var(--muted);
+  margin-bottom: 12px;
+  font-size: 0.9rem;
+}
+.section-title {
+  margin: 14px 0 8px;
+  color: #21446d;
+  font-size: 0.88rem;
+  text-transform: uppercase;
+  letter-spacing: 0.06em;
+  font-weight: 700;
+}
+label {
+  display: block;
+  font-size: 0.84rem;
+  margin-bottom: 6px;
+  color: #21446d;
+  font-weight: 600;
+}
+input, select, textarea {
+  width: 100%;
+  padding: 10px 11px;
+  border: 1px solid #ccd9f2;
+  border-radius: 10px;
+  background: #fcfdff;
+  color: var(--text);
+  margin-bottom: 10px;
+  font: inherit;
+}
+textarea { min-height: 108px; resize: vertical; }
+input:focus, select:focus, textarea:focus {
+  outline: none;
+  border-color: #7da1ff;
+  box-shadow: 0 0 0 3px rgba(41, 98, 255, 0.15);
+}
+.form-grid {
+  display: grid;
+  grid-template-columns: repeat(2, minmax(0, 1fr));
+  gap: 10px;
+}
+.submit-row {
+  display: flex;
+  gap: 10px;
+  align-items: center;
+  margin-top: 6px;
+}
+button {
+  border: none;
+  border-radius: 999px;
+  background: linear-gradient(90deg, #2452d9, #1f7fe2);
+  color: white;
+  font-weight: 700;
+  padding: 11px 18px;
+  cursor: pointer;
+  letter-spacing: 0.02em;
+  box-shadow: 0 10px 22px rgba(33, 86, 194, 0.28);
+}
+button:hover { filter: brightness(1.03); }
+.hint {
+  color: var(--muted);
+  font-size: 0.83rem;
+  margin: 0;
+}
+.result-shell h2 {
+  margin: 0;
+  font-size: 1.15rem;
+}
+.result-shell p { line-height: 1.48; }
+.result-top {
+  display: flex;
+  justify-content: space-between;
+  align-items: center;
+  gap: 8px;
+  margin-bottom: 12px;
+}
+.urgency-pill {
+  display: inline-flex;
+  align-items: center;
+  border-radius: 999px;
+  padding: 5px 11px;
+  font-size: 0.78rem;
+  font-weight: 800;
+  text-transform: uppercase;
+  letter-spacing: 0.05em;
+  border: 1px solid transparent;
+}
+.urgency-self-care { background: #edf7ed; color: #226235; border-color: #b9dfc0; }
+.urgency-routine { background: #eef3ff; color: #234fa8; border-color: #c9d7fb; }
+.urgency-urgent { background: #fff3e6; color: #b26500; border-color: #ffd7ad; }
+.urgency-emergency { background: #ffebee; color: #b71c1c; border-color: #f5b4b4; }
+.alert-banner {
+  background: #fee6e6;
+  border: 1px solid #f7b2b2;
+  color: #9f1c1c;
+  border-radius: 10px;
+  padding: 10px 12px;
+  font-weight: 700;
+  margin-bottom: 10px;
+}
+.conversation {
+  display: grid;
+  gap: 10px;
+  margin-bottom: 12px;
+}
+.bubble {
+  border-radius: 12px;
+  padding: 10px 12px;
+  border: 1px solid #d9e4fa;
+}
+.bubble-title {
+  margin: 0 0 4px;
+  font-size: 0.8rem;
+  font-weight: 700;
+  text-transform: uppercase;
+  letter-spacing: 0.04em;
+  color: #5a6b84;
+}
+.bubble-user { background: #f6f9ff; }
+.bubble-assistant {
+  background: linear-gradient(180deg, #f7fcff, #eef8ff);
+  border-color: #cfe3ff;
+}
+.insight-grid {
+  display: grid;
+  grid-template-columns: repeat(2, minmax(0, 1fr));
+  gap: 10px;
+  margin-bottom: 12px;
+}
+.insight-card {
+  border: 1px solid #d8e4fa;
+  border-radius: 12px;
+  padding: 10px 11px;
+  background: #fcfdff;
+}
+.insight-card h3 { margin: 0 0 8px; font-size: 0.92rem; color: #184276; }
+.insight-card ul { margin: 0; padding-left: 18px; color: #2f4161; }
+.insight-card p { margin: 0; color: #2f4161; }
+.source-wrap h3 {
+  margin: 0 0 8px;
+  font-size: 0.92rem;
+  color: #184276;
+}
+.chip-wrap {
+  display: flex;
+  flex-wrap: wrap;
+  gap: 7px;
+}
+.chip {
+  display: inline-block;
+  border-radius: 999px;
+  padding: 5px 10px;
+  font-size: 0.78rem;
+  background: var(--primary-soft);
+  color: #2a4b96;
+  border: 1px solid #ccdaff;
+  font-weight: 600;
+}
+.chip.muted {
+  background: #f2f4f7;
+  border-color: #e0e5ed;
+  color: #66758f;
+}
+.empty-state p { color: var(--muted); margin: 8px 0 14px; }
+.placeholder-grid {
+  display: grid;
+  grid-template-columns: repeat(2, minmax(0, 1fr));
+  gap: 10px;
+}
+.placeholder-card {
+  border: 1px dashed #cad8f5;
+  border-radius: 10px;
+  padding: 10px;
+  background: #f8fbff;
+}
+.placeholder-card strong {
+  display: block;
+  margin-bottom: 4px;
+  color: #25456f;
+  font-size: 0.85rem;
+}
+.placeholder-card span {
+  color: #5a6b84;
+  font-size: 0.82rem;
+  line-height: 1.35;
+}
+@media (max-width: 1060px) {
+  .workflow-grid { grid-template-columns: repeat(3, minmax(0, 1fr)); }
+  .layout { grid-template-columns: 1fr; }
+}
+@media (max-width: 720px) {
+  .hero h1 { font-size: 1.6rem; }
+  .workflow-grid { grid-template-columns: repeat(2, minmax(0, 1fr)); }
+  .form-grid, .insight-grid, .placeholder-grid { grid-template-columns: 1fr; }
+}
+"""
+_STYLESHEET_BYTES = _STYLESHEET.encode("utf-8")
+_STYLESHEET_ETAG = '"' + hashlib.sha256(_STYLESHEET_BYTES).hexdigest()[:16] + '"'
+_STYLESHEET_PATH = "/static/app.css"
+_STYLESHEET_URL = f"{_STYLESHEET_PATH}?v={_STYLESHEET_ETAG[1:-1]}"
+
+# Static page shell, split once at import. The head has no dynamic parts; the
+# body is a plain str.format template for the form values and the result panel.
+_PAGE_HEAD = f"""<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
   <title>NeuroHealth UI</title>
-  <style>
-    :root {{
-      --bg-1: #f3f7ff;
-      --bg-2: #eefaf5;
-      --panel: #ffffff;
-      --text: #10213a;
-      --muted: #5c6b80;
-      --primary: #2962ff;
-      --primary-soft: #e8eeff;
-      --success: #1e8e3e;
-      --warning: #d97a00;
-      --danger: #c62828;
-      --shadow: 0 14px 40px rgba(16, 33, 58, 0.12);
-      --radius-lg: 18px;
-      --radius-md: 12px;
-    }}
-    * {{ box-sizing: border-box; }}
-    body {{
-      margin: 0;
-      font-family: "Inter", "Segoe UI", Arial, sans-serif;
-      color: var(--text);
-      background:
-        radial-gradient(1200px 600px at 10% -10%, #dfe9ff, transparent 60%),
-        radial-gradient(1000px 500px at 90% -10%, #dcf5e8, transparent 60%),
-        linear-gradient(180deg, var(--bg-1), var(--bg-2));
-    }}
-    .page {{
-      max-width: 1220px;
-      margin: 0 auto;
-      padding: 28px 18px 36px;
-    }}
-    .hero {{
-      background: linear-gradient(120deg, #10213a 0%, #193766 40%, #2550a6 100%);
-      color: #f5f8ff;
-      border-radius: 22px;
-      padding: 24px 24px 18px;
-      box-shadow: var(--shadow);
-      margin-bottom: 16px;
-    }}
-    .hero h1 {{
-      margin: 0 0 10px;
-      font-size: 1.95rem;
-      letter-spacing: 0.2px;
-    }}
-    .hero p {{
-      margin: 0;
-      color: #d8e5ff;
-      line-height: 1.5;
-      max-width: 920px;
-    }}
-    .workflow {{
-      background: var(--panel);
-      border-radius: var(--radius-lg);
-      box-shadow: var(--shadow);
-      padding: 18px;
-      margin-bottom: 16px;
-    }}
-    .workflow h2 {{
-      margin: 0 0 12px;
-      font-size: 1.15rem;
-    }}
-    .workflow-grid {{
-      display: grid;
-      grid-template-columns: repeat(5, minmax(0, 1fr));
-      gap: 10px;
-    }}
-    .workflow-step {{
-      background: linear-gradient(180deg, #f8fbff, #f0f5ff);
-      border: 1px solid #d8e3ff;
-      border-radius: var(--radius-md);
-      padding: 10px 10px 12px;
-    }}
-    .workflow-step strong {{
-      display: block;
-      font-size: 0.84rem;
-      margin-bottom: 4px;
-      color: #16345f;
-    }}
-    .workflow-step span {{
-      color: #5a6b84;
-      font-size: 0.8rem;
-      line-height: 1.35;
-    }}
-    .diagram-panel {{
-      background: var(--panel);
-      border-radius: var(--radius-lg);
-      box-shadow: var(--shadow);
-      padding: 18px;
-      margin-bottom: 16px;
-    }}
-    .diagram-panel h2 {{
-      margin: 0 0 10px;
-      font-size: 1.1rem;
-    }}
-    .diagram-panel p {{
-      margin: 0 0 12px;
-      color: var(--muted);
-      font-size: 0.92rem;
-    }}
-    .diagram-image {{
-      width: 100%;
-      max-height: 360px;
-      object-fit: contain;
-      background: #f7faff;
-      border-radius: var(--radius-md);
-      border: 1px solid #dbe7ff;
-    }}
-    .error-banner {{
-      background: #ffe8e8;
-      border: 1px solid #ffbbbb;
-      color: #7f1d1d;
-      border-radius: 10px;
-      padding: 10px 12px;
-      margin-bottom: 14px;
-      font-weight: 600;
-    }}
-    .layout {{
-      display: grid;
-      grid-template-columns: minmax(320px, 1fr) minmax(380px, 1.15fr);
-      gap: 16px;
-      align-items: start;
-    }}
-    .panel {{
-      background: var(--panel);
-      border-radius: var(--radius-lg);
-      box-shadow: var(--shadow);
-      padding: 18px;
-    }}
-    .panel h2 {{
-      margin: 0 0 12px;
-      font-size: 1.2rem;
-    }}
-    .panel h3 {{
-      margin: 0 0 8px;
-      font-size: 0.98rem;
-    }}
-    .muted {{
-      color: var(--muted);
-      margin-bottom: 12px;
-      font-size: 0.9rem;
-    }}
-    .section-title {{
-      margin: 14px 0 8px;
-      color: #21446d;
-      font-size: 0.88rem;
-      text-transform: uppercase;
-      letter-spacing: 0.06em;
-      font-weight: 700;
-    }}
-    label {{
-      display: block;
-      font-size: 0.84rem;
-      margin-bottom: 6px;
-      color: #21446d;
-      font-weight: 600;
-    }}
-    input, select, textarea {{
-      width: 100%;
-      padding: 10px 11px;
-      border: 1px solid #ccd9f2;
-      border-radius: 10px;
-      background: #fcfdff;
-      color: var(--text);
-      margin-bottom: 10px;
-      font: inherit;
-    }}
-    textarea {{ min-height: 108px; resize: vertical; }}
-    input:focus, select:focus, textarea:focus {{
-      outline: none;
-      border-color: #7da1ff;
-      box-shadow: 0 0 0 3px rgba(41, 98, 255, 0.15);
-    }}
-    .form-grid {{
-      display: grid;
-      grid-template-columns: repeat(2, minmax(0, 1fr));
-      gap: 10px;
-    }}
-    .submit-row {{
-      display: flex;
-      gap: 10px;
-      align-items: center;
-      margin-top: 6px;
-    }}
-    button {{
-      border: none;
-      border-radius: 999px;
-      background: linear-gradient(90deg, #2452d9, #1f7fe2);
-      color: white;
-      font-weight: 700;
-      padding: 11px 18px;
-      cursor: pointer;
-      letter-spacing: 0.02em;
-      box-shadow: 0 10px 22px rgba(33, 86, 194, 0.28);
-    }}
-    button:hover {{ filter: brightness(1.03); }}
-    .hint {{
-      color: var(--muted);
-      font-size: 0.83rem;
-      margin: 0;
-    }}
-    .result-shell h2 {{
-      margin: 0;
-      font-size: 1.15rem;
-    }}
-    .result-shell p {{ line-height: 1.48; }}
-    .result-top {{
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      gap: 8px;
-      margin-bottom: 12px;
-    }}
-    .urgency-pill {{
-      display: inline-flex;
-      align-items: center;
-      border-radius: 999px;
-      padding: 5px 11px;
-      font-size: 0.78rem;
-      font-weight: 800;
-      text-transform: uppercase;
-      letter-spacing: 0.05em;
-      border: 1px solid transparent;
-    }}
-    .urgency-self-care {{ background: #edf7ed; color: #226235; border-color: #b9dfc0; }}
-    .urgency-routine {{ background: #eef3ff; color: #234fa8; border-color: #c9d7fb; }}
-    .urgency-urgent {{ background: #fff3e6; color: #b26500; border-color: #ffd7ad; }}
-    .urgency-emergency {{ background: #ffebee; color: #b71c1c; border-color: #f5b4b4; }}
-    .alert-banner {{
-      background: #fee6e6;
-      border: 1px solid #f7b2b2;
-      color: #9f1c1c;
-      border-radius: 10px;
-      padding: 10px 12px;
-      font-weight: 700;
-      margin-bottom: 10px;
-    }}
-    .conversation {{
-      display: grid;
-      gap: 10px;
-      margin-bottom: 12px;
-    }}
-    .bubble {{
-      border-radius: 12px;
-      padding: 10px 12px;
-      border: 1px solid #d9e4fa;
-    }}
-    .bubble-title {{
-      margin: 0 0 4px;
-      font-size: 0.8rem;
-      font-weight: 700;
-      text-transform: uppercase;
-      letter-spacing: 0.04em;
-      color: #5a6b84;
-    }}
-    .bubble-user {{ background: #f6f9ff; }}
-    .bubble-assistant {{
-      background: linear-gradient(180deg, #f7fcff, #eef8ff);
-      border-color: #cfe3ff;
-    }}
-    .insight-grid {{
-      display: grid;
-      grid-template-columns: repeat(2, minmax(0, 1fr));
-      gap: 10px;
-      margin-bottom: 12px;
-    }}
-    .insight-card {{
-      border: 1px solid #d8e4fa;
-      border-radius: 12px;
-      padding: 10px 11px;
-      background: #fcfdff;
-    }}
-    .insight-card h3 {{ margin: 0 0 8px; font-size: 0.92rem; color: #184276; }}
-    .insight-card ul {{ margin: 0; padding-left: 18px; color: #2f4161; }}
-    .insight-card p {{ margin: 0; color: #2f4161; }}
-    .source-wrap h3 {{
-      margin: 0 0 8px;
-      font-size: 0.92rem;
-      color: #184276;
-    }}
-    .chip-wrap {{
-      display: flex;
-      flex-wrap: wrap;
-      gap: 7px;
-    }}
-    .chip {{
-      display: inline-block;
-      border-radius: 999px;
-      padding: 5px 10px;
-      font-size: 0.78rem;
-      background: var(--primary-soft);
-      color: #2a4b96;
-      border: 1px solid #ccdaff;
-      font-weight: 600;
-    }}
-    .chip.muted {{
-      background: #f2f4f7;
-      border-color: #e0e5ed;
-      color: #66758f;
-    }}
-    .empty-state p {{ color: var(--muted); margin: 8px 0 14px; }}
-    .placeholder-grid {{
-      display: grid;
-      grid-template-columns: repeat(2, minmax(0, 1fr));
-      gap: 10px;
-    }}
-    .placeholder-card {{
-      border: 1px dashed #cad8f5;
-      border-radius: 10px;
-      padding: 10px;
-      background: #f8fbff;
-    }}
-    .placeholder-card strong {{
-      display: block;
-      margin-bottom: 4px;
-      color: #25456f;
-      font-size: 0.85rem;
-    }}
-    .placeholder-card span {{
-      color: #5a6b84;
-      font-size: 0.82rem;
-      line-height: 1.35;
-    }}
-    @media (max-width: 1060px) {{
-      .workflow-grid {{ grid-template-columns: repeat(3, minmax(0, 1fr)); }}
-      .layout {{ grid-template-columns: 1fr; }}
-    }}
-    @media (max-width: 720px) {{
-      .hero h1 {{ font-size: 1.6rem; }}
-      .workflow-grid {{ grid-template-columns: repeat(2, minmax(0, 1fr)); }}
-      .form-grid, .insight-grid, .placeholder-grid {{ grid-template-columns: 1fr; }}
-    }}
-  </style>
+  <link rel="stylesheet" href="{_STYLESHEET_URL}" />
 </head>
 <body>
   <div class="page">
@@ -487,7 +509,9 @@ def _render_page(form: dict[str, str], result: Recommendation | None = None, err
       <img src="/diagram.png" alt="NeuroHealth architecture diagram" class="diagram-image" />
     </section>
 
-    {error_html}
+    """
+
+_PAGE_BODY = """{error_html}
 
     <main class="layout">
       <section class="panel">
@@ -495,48 +519,48 @@ def _render_page(form: dict[str, str], result: Recommendation | None = None, err
         <p class="muted">Provide natural-language symptoms and optional context for personalization.</p>
         <form method="post" action="/recommend">
           <label for="query">Health question or symptom narrative *</label>
-          <textarea id="query" name="query" required placeholder="Example: I have mild fever and cough for 2 days and want to know if I should book an appointment.">{_escape(_value(form, "query"))}</textarea>
+          <textarea id="query" name="query" required placeholder="Example: I have mild fever and cough for 2 days and want to know if I should book an appointment.">{query}</textarea>
 
           <p class="section-title">Profile</p>
           <div class="form-grid">
             <div>
               <label for="age">Age</label>
-              <input id="age" name="age" type="number" min="1" value="{_escape(_value(form, "age"))}" />
+              <input id="age" name="age" type="number" min="1" value="{age}" />
             </div>
             <div>
               <label for="health_literacy">Health literacy</label>
               <select id="health_literacy" name="health_literacy">
-                <option value="basic"{_selected(_value(form, "health_literacy", "intermediate"), "basic")}>basic</option>
-                <option value="intermediate"{_selected(_value(form, "health_literacy", "intermediate"), "intermediate")}>intermediate</option>
-                <option value="advanced"{_selected(_value(form, "health_literacy", "intermediate"), "advanced")}>advanced</option>
+                <option value="basic"{basic_selected}>basic</option>
+                <option value="intermediate"{intermediate_selected}>intermediate</option>
+                <option value="advanced"{advanced_selected}>advanced</option>
               </select>
             </div>
           </div>
 
           <label for="preferences">Preferences (comma-separated)</label>
-          <input id="preferences" name="preferences" placeholder="vegetarian, low-impact exercise" value="{_escape(_value(form, "preferences"))}" />
+          <input id="preferences" name="preferences" placeholder="vegetarian, low-impact exercise" value="{preferences}" />
           <label for="medical_constraints">Medical constraints (comma-separated)</label>
-          <input id="medical_constraints" name="medical_constraints" placeholder="knee pain, hypertension" value="{_escape(_value(form, "medical_constraints"))}" />
+          <input id="medical_constraints" name="medical_constraints" placeholder="knee pain, hypertension" value="{medical_constraints}" />
           <label for="chronic_conditions">Chronic conditions (comma-separated)</label>
-          <input id="chronic_conditions" name="chronic_conditions" placeholder="asthma, diabetes" value="{_escape(_value(form, "chronic_conditions"))}" />
+          <input id="chronic_conditions" name="chronic_conditions" placeholder="asthma, diabetes" value="{chronic_conditions}" />
 
           <p class="section-title">Symptoms + vital context</p>
           <div class="form-grid">
             <div>
               <label for="symptoms">Symptoms (comma-separated)</label>
-              <input id="symptoms" name="symptoms" placeholder="fever, dry cough, fatigue" value="{_escape(_value(form, "symptoms"))}" />
+              <input id="symptoms" name="symptoms" placeholder="fever, dry cough, fatigue" value="{symptoms}" />
             </div>
             <div>
               <label for="duration_hours">Duration (hours)</label>
-              <input id="duration_hours" name="duration_hours" type="number" min="0" value="{_escape(_value(form, "duration_hours"))}" />
+              <input id="duration_hours" name="duration_hours" type="number" min="0" value="{duration_hours}" />
             </div>
             <div>
               <label for="pain_level">Pain level (0-10)</label>
-              <input id="pain_level" name="pain_level" type="number" min="0" max="10" value="{_escape(_value(form, "pain_level"))}" />
+              <input id="pain_level" name="pain_level" type="number" min="0" max="10" value="{pain_level}" />
             </div>
             <div>
               <label for="biometrics">Biometrics key=value, comma-separated</label>
-              <input id="biometrics" name="biometrics" placeholder="temperature_c=38.1,oxygen_saturation=97" value="{_escape(_value(form, "biometrics"))}" />
+              <input id="biometrics" name="biometrics" placeholder="temperature_c=38.1,oxygen_saturation=97" value="{biometrics}" />
             </div>
           </div>
 
@@ -544,11 +568,11 @@ def _render_page(form: dict[str, str], result: Recommendation | None = None, err
           <div class="form-grid">
             <div>
               <label for="feedback_rating">Feedback rating (1-5)</label>
-              <input id="feedback_rating" name="feedback_rating" type="number" min="1" max="5" value="{_escape(_value(form, "feedback_rating"))}" />
+              <input id="feedback_rating" name="feedback_rating" type="number" min="1" max="5" value="{feedback_rating}" />
             </div>
             <div>
               <label for="feedback_comment">Feedback comment</label>
-              <input id="feedback_comment" name="feedback_comment" placeholder="Was the recommendation clear?" value="{_escape(_value(form, "feedback_comment"))}" />
+              <input id="feedback_comment" name="feedback_comment" placeholder="Was the recommendation clear?" value="{feedback_comment}" />
             </div>
           </div>
 
@@ -569,73 +593,261 @@ def _render_page(form: dict[str, str], result: Recommendation | None = None, err
 """
 
 
+_EMPTY_RESULT_HTML = """<section class="result-shell empty-state">
+  <h2>Clinical Guidance Output</h2>
+  <p>Your recommendation appears here after submitting the intake form.</p>
+  <div class="placeholder-grid">
+    <div class="placeholder-card"><strong>Urgency assessment</strong><span>self-care / routine / urgent / emergency</span></div>
+    <div class="placeholder-card"><strong>Appointment routing</strong><span>primary care, same-day care, or emergency escalation</span></div>
+    <div class="placeholder-card"><strong>Safety guidance</strong><span>red-flag instructions and escalation cues</span></div>
+    <div class="placeholder-card"><strong>Knowledge grounding</strong><span>evidence snippets from validated sources</span></div>
+  </div>
+</section>"""
+_ERROR_BANNER_TEMPLATE = '<div class="error-banner">{}</div>'
+
+
+def _render_page(form: dict[str, str], result: Recommendation | None = None, error: str = "") -> str:
+    escaped_query = _escape(_value(form, "query"))
+    result_html = _render_recommendation(result, escaped_query) if result else _EMPTY_RESULT_HTML
+    error_html = _ERROR_BANNER_TEMPLATE.format(_escape(error)) if error else ""
+
+    basic_selected, intermediate_selected, advanced_selected = _HEALTH_LITERACY_SELECTED.get(
+        _value(form, "health_literacy", "intermediate"),
+        _NONE_SELECTED,
+    )
+
+    return "".join(
+        (
+            _PAGE_HEAD,
+            _PAGE_BODY.format(
+                error_html=error_html,
+                query=escaped_query,
+                age=_escape(_value(form, "age")),
+                basic_selected=basic_selected,
+                intermediate_selected=intermediate_selected,
+                advanced_selected=advanced_selected,
+                preferences=_escape(_value(form, "preferences")),
+                medical_constraints=_escape(_value(form, "medical_constraints")),
+                chronic_conditions=_escape(_value(form, "chronic_conditions")),
+                symptoms=_escape(_value(form, "symptoms")),
+                duration_hours=_escape(_value(form, "duration_hours")),
+                pain_level=_escape(_value(form, "pain_level")),
+                biometrics=_escape(_value(form, "biometrics")),
+                feedback_rating=_escape(_value(form, "feedback_rating")),
+                feedback_comment=_escape(_value(form, "feedback_comment")),
+                result_html=result_html,
+            ),
+        )
+    )
+
+
+_HTML_CONTENT_TYPE = "text/html; charset=utf-8"
+
+# The landing page never varies, so it is rendered and encoded once.
+_EMPTY_PAGE_BYTES = _render_page({}).encode("utf-8")
+
+def _result_page_bytes(form: dict[str, str], recommendation: Recommendation) -> bytes:
+    # Rendered per request and never cached: result pages carry the user's health
+    # details and the model's answer, and repeats of both are too rare to help.
+    return _render_page(form, recommendation).encode("utf-8")
+
+
 def _parse_form(body: bytes) -> dict[str, str]:
-    parsed = parse_qs(body.decode("utf-8"), keep_blank_values=True)
-    return {key: values[0] if values else "" for key, values in parsed.items()}
+    # Same pairs as parse_qs(..., keep_blank_values=True) keeping the first value
+    # per key, without building a list for every field. Values are trimmed here
+    # once, so the request builders below can use them as-is.
+    form: dict[str, str] = {}
+    for pair in body.decode("utf-8").split("&"):
+        if not pair:
+            continue
+        key, _, value = pair.partition("=")
+        form.setdefault(unquote_plus(key), unquote_plus(value).strip())
+    return form
 
 
 def _build_request(form: dict[str, str]) -> NeuroHealthRequest:
-    query = _value(form, "query").strip()
+    # Fields are read with the bound form.get rather than _value() to skip a
+    # Python-level call per field on every submission.
+    field = form.get
+    query = field("query", "")
     if not query:
         raise ValueError("Health question is required.")
 
-    health_literacy_raw = _value(form, "health_literacy", "intermediate")
-    if health_literacy_raw not in {"basic", "intermediate", "advanced"}:
+    health_literacy_raw = field("health_literacy", "intermediate")
+    if health_literacy_raw not in _HEALTH_LITERACY_SELECTED:
         raise ValueError("Health literacy must be one of: basic, intermediate, advanced.")
     health_literacy: Literal["basic", "intermediate", "advanced"] = health_literacy_raw
 
-    biometrics_raw = _value(form, "biometrics")
-    biometrics_items = [item.strip() for item in biometrics_raw.split(",") if item.strip()]
-
     profile = UserProfile(
-        age=parse_optional_int(_value(form, "age")),
-        preferences=parse_csv(_value(form, "preferences")),
-        medical_constraints=parse_csv(_value(form, "medical_constraints")),
-        chronic_conditions=parse_csv(_value(form, "chronic_conditions")),
+        age=parse_optional_int(field("age")),
+        preferences=parse_csv(field("preferences")),
+        medical_constraints=parse_csv(field("medical_constraints")),
+        chronic_conditions=parse_csv(field("chronic_conditions")),
         health_literacy=health_literacy,
     )
     symptoms = SymptomReport(
-        symptoms=parse_csv(_value(form, "symptoms")),
-        biometrics=parse_biometrics(biometrics_items),
-        duration_hours=parse_optional_int(_value(form, "duration_hours")),
-        pain_level=parse_optional_int(_value(form, "pain_level")),
+        symptoms=parse_csv(field("symptoms")),
+        biometrics=parse_biometrics(parse_csv(field("biometrics"))),
+        duration_hours=parse_optional_int(field("duration_hours")),
+        pain_level=parse_optional_int(field("pain_level")),
     )
     return NeuroHealthRequest(user_input=query, user_profile=profile, symptom_report=symptoms, history=[])
 
 
 def _record_feedback_if_present(engine: NeuroHealthEngine, form: dict[str, str]) -> None:
-    rating_text = _value(form, "feedback_rating").strip()
+    rating_text = _value(form, "feedback_rating")
     if not rating_text:
         return
     feedback = RecommendationFeedback(
-        conversation_id=str(uuid4()),
-        rating=int(rating_text),
-        comment=_value(form, "feedback_comment").strip(),
+        conversation_id=new_conversation_id(),
+        rating=int(rating_text, 10),
+        comment=_value(form, "feedback_comment"),
     )
     engine.record_feedback(feedback)
 
 
+def _open_diagram() -> BinaryIO | None:
+    for diagram_path in (DIAGRAM_PATH, LEGACY_DIAGRAM_PATH):
+        try:
+            return diagram_path.open("rb")
+        except FileNotFoundError:
+            continue
+    return None
+
+
+class _BatchEmbeddingError(Exception):
+    # A shared embed_queries() call failed; each caller retries its own query.
+    pass
+
+
+class _QueryEmbeddingBatcher:
+    # Coalesces the retrieval queries of concurrent /recommend submissions into one
+    # embed_queries() round-trip; a batch closes after max_batch_size queries or
+    # max_batch_delay seconds after its first one. Only embedding is batched:
+    # assessment, search and the LLM call stay on each request's own thread, and
+    # emergencies return before ever asking for a query vector.
+    _MAX_BATCH_SIZE = 8
+    _MAX_BATCH_DELAY = 0.005
+    _RESULT_TIMEOUT = 60.0
+
+    def __init__(
+        self,
+        client: EmbeddingClient,
+        max_batch_size: int = _MAX_BATCH_SIZE,
+        max_batch_delay: float = _MAX_BATCH_DELAY,
+        result_timeout: float = _RESULT_TIMEOUT,
+    ) -> None:
+        self._client = client
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay = max_batch_delay
+        self._result_timeout = result_timeout
+        self._pending: queue.SimpleQueue[tuple[str, Future[list[float]]]] = queue.SimpleQueue()
+        threading.Thread(target=self._run, name="neurohealth-embedding-batcher", daemon=True).start()
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        return self._client.embed_texts(texts)
+
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        return self._client.embed_queries(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        future: Future[list[float]] = Future()
+        self._pending.put((text, future))
+        try:
+            return future.result(timeout=self._result_timeout)
+        except _BatchEmbeddingError:
+            # Only this query is retried, on this thread; its neighbours do the same
+            # and a genuinely bad query fails on its own.
+            return self._client.embed_query(text)
+        except TimeoutError:
+            future.cancel()
+            raise TimeoutError("Timed out waiting for the query embedding.") from None
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + self._max_batch_delay
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: list[tuple[str, Future[list[float]]]]) -> None:
+        # Callers that already timed out cancelled their future; skip them.
+        batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            vectors = dict(zip(texts, self._client.embed_queries(texts)))
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc if len(texts) == 1 else _BatchEmbeddingError())
+            return
+        for text, future in batch:
+            future.set_result(list(vectors[text]))
+
+
 def _create_handler(engine_factory: Callable[[], NeuroHealthEngine]) -> type[BaseHTTPRequestHandler]:
+    # The diagram is a static asset, opened once per server. Where os.sendfile is
+    # available the kernel copies it straight from the page cache to the socket;
+    # _send_file only ever passes explicit offsets to os.sendfile and never seeks
+    # or reads the handle, so threads can share it. Elsewhere its bytes are read
+    # once and written from memory.
+    diagram_file = _open_diagram()
+    diagram_size = os.fstat(diagram_file.fileno()).st_size if diagram_file is not None else 0
+    diagram_bytes: bytes | None = None
+    if diagram_file is not None and not hasattr(os, "sendfile"):
+        with diagram_file:
+            diagram_bytes = diagram_file.read()
+        diagram_file = None
+
     class Handler(BaseHTTPRequestHandler):
+        # HTTP/1.1 keeps connections open, so a browser fetches the page, the
+        # stylesheet and the diagram over one socket. Every response carries a
+        # Content-Length; idle connections are dropped after `timeout` seconds.
+        protocol_version = "HTTP/1.1"
+        timeout = 30
+
+        # One engine serves every request thread: generate() keeps no per-request
+        # state and its clients/stores handle concurrency themselves. The lock only
+        # stops concurrent first requests from each building an engine.
         _engine: NeuroHealthEngine | None = None
+        _batcher: _QueryEmbeddingBatcher | None = None
+        _engine_lock = threading.Lock()
 
         def _get_engine(self) -> NeuroHealthEngine:
-            if type(self)._engine is None:
-                type(self)._engine = engine_factory()
-            return type(self)._engine
+            engine = type(self)._engine
+            if engine is None:
+                with self._engine_lock:
+                    if type(self)._engine is None:
+                        created = engine_factory()
+                        type(self)._batcher = _QueryEmbeddingBatcher(created.embedding_client)
+                        type(self)._engine = created
+                    engine = type(self)._engine
+            return engine
 
         def do_GET(self) -> None:
             if self.path == "/diagram.png":
-                diagram_path = DIAGRAM_PATH if DIAGRAM_PATH.exists() else LEGACY_DIAGRAM_PATH
-                if not diagram_path.exists():
+                if diagram_file is not None:
+                    self._send_file(diagram_file, diagram_size, "image/png")
+                elif diagram_bytes is not None:
+                    self._send_binary(diagram_bytes, "image/png")
+                else:
                     self.send_error(HTTPStatus.NOT_FOUND, "Diagram image not found")
-                    return
-                self._send_binary(diagram_path.read_bytes(), "image/png")
+                return
+            if self.path.partition("?")[0] == _STYLESHEET_PATH:
+                self._send_stylesheet()
                 return
             if self.path not in {"/", "/index.html"}:
                 self.send_error(HTTPStatus.NOT_FOUND, "Not found")
                 return
-            self._send_html(_render_page({}))
+            self._send_binary(_EMPTY_PAGE_BYTES, _HTML_CONTENT_TYPE)
 
         def do_POST(self) -> None:
             if self.path != "/recommend":
@@ -648,9 +860,9 @@ def _create_handler(engine_factory: Callable[[], NeuroHealthEngine]) -> type[Bas
             try:
                 request_payload = _build_request(form)
                 engine = self._get_engine()
-                recommendation = engine.generate(request_payload)
+                recommendation = engine.generate(request_payload, embedding_client=self._batcher)
                 _record_feedback_if_present(engine, form)
-                self._send_html(_render_page(form, recommendation))
+                self._send_binary(_result_page_bytes(form, recommendation), _HTML_CONTENT_TYPE)
             except Exception as exc:
                 self._send_html(_render_page(form, error=str(exc)), status=HTTPStatus.BAD_REQUEST)
 
@@ -658,29 +870,86 @@ def _create_handler(engine_factory: Callable[[], NeuroHealthEngine]) -> type[Bas
             return
 
         def _send_html(self, payload: str, status: HTTPStatus = HTTPStatus.OK) -> None:
-            encoded = payload.encode("utf-8")
-            self.send_response(status)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(encoded)))
-            self.end_headers()
-            self.wfile.write(encoded)
+            self._send_binary(payload.encode("utf-8"), _HTML_CONTENT_TYPE, status)
+
+        def _send_stylesheet(self) -> None:
+            cache_headers = (
+                ("ETag", _STYLESHEET_ETAG),
+                ("Cache-Control", "public, max-age=31536000, immutable"),
+            )
+            if_none_match = self.headers.get("If-None-Match", "")
+            if if_none_match and (
+                if_none_match.strip() == "*"
+                or _STYLESHEET_ETAG in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+            ):
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                for name, value in cache_headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                return
+            self._send_binary(_STYLESHEET_BYTES, "text/css; charset=utf-8", headers=cache_headers)
 
         def _send_binary(
             self,
             payload: bytes,
             content_type: str,
             status: HTTPStatus = HTTPStatus.OK,
+            headers: tuple[tuple[str, str], ...] = (),
+        ) -> None:
+            # The headers and body are queued behind the status line, so the whole
+            # response goes out in one write.
+            self._send_preamble(status, content_type, len(payload), headers, payload)
+
+        def _send_file(self, file: BinaryIO, size: int, content_type: str) -> None:
+            # socket.sendfile() is not used: when os.sendfile gives up it falls back
+            # to seek()+read() on the file object, which races on a shared handle.
+            self._send_preamble(HTTPStatus.OK, content_type, size)
+            socket_fd = self.connection.fileno()
+            file_fd = file.fileno()
+            timeout = self.connection.gettimeout()
+            offset = 0
+            while offset < size:
+                try:
+                    sent = os.sendfile(socket_fd, file_fd, offset, size - offset)
+                except BlockingIOError:
+                    # Sockets with a timeout are non-blocking at the OS level.
+                    if not select.select([], [socket_fd], [], timeout)[1]:
+                        raise TimeoutError("timed out sending the diagram") from None
+                    continue
+                if sent == 0:
+                    # The file shrank under us; the promised length cannot be met.
+                    self.close_connection = True
+                    return
+                offset += sent
+
+        def _send_preamble(
+            self,
+            status: HTTPStatus,
+            content_type: str,
+            content_length: int,
+            headers: tuple[tuple[str, str], ...] = (),
+            payload: bytes = b"",
         ) -> None:
             self.send_response(status)
-            self.send_header("Content-Type", content_type)
-            self.send_header("Content-Length", str(len(payload)))
-            self.end_headers()
-            self.wfile.write(payload)
+            if self.request_version == "HTTP/0.9":
+                # No header block exists for HTTP/0.9; only the body is sent.
+                self.wfile.write(payload)
+                return
+            # The headers are formatted as one block instead of a send_header()
+            # call per header.
+            header_block = f"Content-Type: {content_type}\r\nContent-Length: {content_length}\r\n"
+            header_block += "".join([f"{name}: {value}\r\n" for name, value in headers])
+            self._headers_buffer.extend(((header_block + "\r\n").encode("latin-1"), payload))
+            self.flush_headers()
 
     return Handler
 
 
 def _build_parser() -> argparse.ArgumentParser:
+    # Imported here so importing the UI module (e.g. for _create_handler in tests
+    # or embedding) does not pay for argparse and gettext.
+    import argparse
+
     parser = argparse.ArgumentParser(description="NeuroHealth interactive web UI")
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind (default: 127.0.0.1)")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind (default: 8000)")
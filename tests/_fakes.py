@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+# One scan per text finds every feature keyword; each maps to a vector column.
+_FEATURE_PATTERN = re.compile(r"fever|cough|nutrition|vegetarian")
+_FEATURE_COLUMNS = {"fever": 0, "cough": 1, "nutrition": 2, "vegetarian": 2}
+
+
+@lru_cache(maxsize=1024)
+def _to_vector(text: str) -> tuple[float, ...]:
+    # Cached as an immutable tuple; callers get a fresh list at the boundary.
+    vector = [0.0, 0.0, 0.0, 1.0]
+    for keyword in _FEATURE_PATTERN.findall(text.lower()):
+        vector[_FEATURE_COLUMNS[keyword]] = 1.0
+    return tuple(vector)
+
+
+class FakeEmbeddingClient:
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        return [list(_to_vector(text)) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return list(_to_vector(text))
+
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        return self.embed_texts(texts)
+
+
+# Stateless, so one instance serves every test module in the process.
+FAKE_EMBEDDER = FakeEmbeddingClient()
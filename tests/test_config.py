@@ -53,6 +53,25 @@ class SettingsTests(unittest.TestCase):
 
             self.assertEqual(settings.github_token, "legacy-token")
 
+    def test_from_env_picks_up_dotenv_edits(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir, mock.patch.dict(os.environ, {}, clear=True):
+            env_path = Path(temp_dir, ".env")
+            env_path.write_text("GEMINI_API_KEY=first\nGITHUB_TOKEN=token\n", encoding="utf-8")
+            old_cwd = os.getcwd()
+            os.chdir(temp_dir)
+            try:
+                first = Settings.from_env()
+                self.assertIs(Settings.from_env(), first)
+
+                os.environ.clear()
+                env_path.write_text("GEMINI_API_KEY=second-key\nGITHUB_TOKEN=token\n", encoding="utf-8")
+                second = Settings.from_env()
+            finally:
+                os.chdir(old_cwd)
+
+            self.assertEqual(first.gemini_api_key, "first")
+            self.assertEqual(second.gemini_api_key, "second-key")
+
 
 if __name__ == "__main__":
     unittest.main()
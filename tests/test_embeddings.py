@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import unittest
+
+from neurohealth.embeddings import GitHubModelsEmbeddingClient
+from neurohealth.kb import KnowledgeIndex
+from neurohealth.models import KnowledgeChunk
+
+
+class GitHubModelsEmbeddingClientTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.posted: list[object] = []
+
+        def post_json(url: str, headers: dict[str, str], payload: dict[str, object]) -> dict[str, object]:
+            self.posted.append(payload["input"])
+            return {"data": [{"index": 0, "embedding": [1.0, 0.0]}]}
+
+        self.client = GitHubModelsEmbeddingClient(api_key="token", post_json=post_json)
+
+    def test_repeated_query_is_embedded_once(self) -> None:
+        index = KnowledgeIndex(
+            chunks=[KnowledgeChunk(id="f1", title="Fever", content="Rest.", source="Source A")],
+            vectors=[[1.0, 0.0]],
+        )
+        first = index.retrieve("I have high fever", self.client, top_k=1)
+        second = index.retrieve("I have high fever", self.client, top_k=1)
+
+        self.assertEqual(self.posted, [["I have high fever"]])
+        self.assertEqual(first, second)
+
+    def test_embed_queries_only_requests_distinct_misses(self) -> None:
+        self.client.embed_query("fever")
+        self.posted.clear()
+        vectors = self.client.embed_queries(["fever", "cough", "cough"])
+        self.assertEqual(vectors, [[1.0, 0.0]] * 3)
+        self.assertEqual(self.posted, [["cough"]])
+
+    def test_cached_query_vector_is_not_shared(self) -> None:
+        vector = self.client.embed_query("cough")
+        vector.append(9.0)
+        self.assertEqual(self.client.embed_query("cough"), [1.0, 0.0])
+        self.assertEqual(len(self.posted), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,32 +1,21 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from neurohealth.engine import NeuroHealthEngine
-from neurohealth.feedback import FeedbackStore
+from neurohealth.feedback import FeedbackStore, new_conversation_id
 from neurohealth.kb import KnowledgeIndex
 from neurohealth.models import NeuroHealthRequest, RecommendationFeedback, SymptomReport, UserProfile
 
+from _fakes import FAKE_EMBEDDER
 
-class FakeEmbeddingClient:
-    def embed_texts(self, texts: list[str]) -> list[list[float]]:
-        return [self._to_vector(text) for text in texts]
-
-    def embed_query(self, text: str) -> list[float]:
-        return self._to_vector(text)
-
-    @staticmethod
-    def _to_vector(text: str) -> list[float]:
-        lowered = text.lower()
-        return [
-            1.0 if "fever" in lowered else 0.0,
-            1.0 if "cough" in lowered else 0.0,
-            1.0 if "nutrition" in lowered or "vegetarian" in lowered else 0.0,
-            1.0,
-        ]
+_MODULE_TMP: Path
 
 
 class FakeGeminiClient:
@@ -40,12 +29,23 @@ class FakeGeminiClient:
         return "Hydrate, monitor symptoms, and book follow-up care based on urgency."
 
 
+def setUpModule() -> None:
+    global _MODULE_TMP
+    _MODULE_TMP = Path(tempfile.mkdtemp(prefix=f"neurohealth-engine-tests-{os.getpid()}-"))
+
+
+def tearDownModule() -> None:
+    shutil.rmtree(_MODULE_TMP, ignore_errors=True)
+
+
 class NeuroHealthEngineTests(unittest.TestCase):
-    def setUp(self) -> None:
-        self.temp_dir = tempfile.TemporaryDirectory()
-        base = Path(self.temp_dir.name)
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The knowledge base and its index are read-only, so every test shares one
+        # build; only the feedback store and clients are per test.
+        cls.base = Path(tempfile.mkdtemp(dir=_MODULE_TMP))
 
-        kb_path = base / "kb.json"
+        kb_path = cls.base / "kb.json"
         kb_payload = [
             {
                 "id": "fever",
@@ -63,11 +63,12 @@ class NeuroHealthEngineTests(unittest.TestCase):
             },
         ]
         kb_path.write_text(json.dumps(kb_payload), encoding="utf-8")
+        cls.knowledge_index = KnowledgeIndex.build(kb_path, FAKE_EMBEDDER)
 
-        self.embedding_client = FakeEmbeddingClient()
-        self.knowledge_index = KnowledgeIndex.build(kb_path, self.embedding_client)
+    def setUp(self) -> None:
+        self.embedding_client = FAKE_EMBEDDER
         self.llm_client = FakeGeminiClient()
-        self.feedback_store = FeedbackStore(base / "feedback.jsonl")
+        self.feedback_store = FeedbackStore(self.base / f"feedback-{self._testMethodName}.jsonl")
         self.engine = NeuroHealthEngine(
             knowledge_index=self.knowledge_index,
             embedding_client=self.embedding_client,
@@ -76,7 +77,7 @@ class NeuroHealthEngineTests(unittest.TestCase):
         )
 
     def tearDown(self) -> None:
-        self.temp_dir.cleanup()
+        self.feedback_store.close()
 
     def test_emergency_path_bypasses_llm(self) -> None:
         request = NeuroHealthRequest(
@@ -101,6 +102,55 @@ class NeuroHealthEngineTests(unittest.TestCase):
         self.assertIn("Hydrate", recommendation.assistant_message)
         self.assertTrue(recommendation.sources)
 
+    def test_knowledge_index_factory_is_deferred_until_retrieval(self) -> None:
+        builds: list[int] = []
+
+        def factory() -> KnowledgeIndex:
+            builds.append(1)
+            return self.knowledge_index
+
+        engine = NeuroHealthEngine(
+            knowledge_index=factory,
+            embedding_client=self.embedding_client,
+            llm_client=self.llm_client,
+            feedback_store=self.feedback_store,
+        )
+        engine.generate(
+            NeuroHealthRequest(
+                user_input="I have chest pain",
+                symptom_report=SymptomReport(symptoms=["chest pain"]),
+            )
+        )
+        self.assertEqual(builds, [])
+
+        for _ in range(2):
+            engine.generate(NeuroHealthRequest(user_input="I have mild fever"))
+        self.assertEqual(builds, [1])
+
+    def test_generate_batch_matches_generate_with_one_embedding_call(self) -> None:
+        requests = [
+            NeuroHealthRequest(user_input="I have mild fever"),
+            NeuroHealthRequest(
+                user_input="I have chest pain",
+                symptom_report=SymptomReport(symptoms=["chest pain"]),
+            ),
+            NeuroHealthRequest(user_input="I am vegetarian and want nutrition advice"),
+        ]
+        embed_calls: list[list[str]] = []
+        embed_texts = self.embedding_client.embed_texts
+
+        def counting_embed_texts(texts: list[str]) -> list[list[float]]:
+            embed_calls.append(texts)
+            return embed_texts(texts)
+
+        # The embedder is shared across tests, so the spy must be undone afterwards.
+        with mock.patch.object(self.embedding_client, "embed_texts", counting_embed_texts):
+            batch = self.engine.generate_batch(requests)
+
+        self.assertEqual(embed_calls, [[requests[0].user_input, requests[2].user_input]])
+        self.assertEqual(self.llm_client.call_count, 2)
+        self.assertEqual(batch, [self.engine.generate(request) for request in requests])
+
     def test_feedback_persistence(self) -> None:
         feedback = RecommendationFeedback(
             conversation_id="test-convo",
@@ -111,6 +161,43 @@ class NeuroHealthEngineTests(unittest.TestCase):
         records = self.feedback_store.read_all()
         self.assertEqual(len(records), 1)
         self.assertEqual(records[0].rating, 5)
+        raw = list(self.feedback_store.iter_raw())
+        self.assertEqual(raw, [{"conversation_id": "test-convo", "rating": 5, "comment": "Helpful and clear guidance."}])
+
+    def test_recorded_feedback_is_visible_in_the_file_immediately(self) -> None:
+        self.engine.record_feedback(RecommendationFeedback(conversation_id="c1", rating=4, comment="ok"))
+        lines = self.feedback_store.path.read_bytes().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], [{"conversation_id": "c1", "rating": 4, "comment": "ok"}])
+
+    def test_record_many_appends_in_order(self) -> None:
+        batch = [
+            RecommendationFeedback(conversation_id=f"convo-{index}", rating=index % 5 + 1, comment=f"note {index}")
+            for index in range(1000)
+        ]
+        self.feedback_store.record(batch[0])
+        self.feedback_store.record_many(batch[1:])
+        self.feedback_store.record_many([])
+        self.assertEqual(self.feedback_store.read_all(), batch)
+
+    def test_new_conversation_ids_are_unique(self) -> None:
+        ids = {new_conversation_id() for _ in range(1000)}
+        self.assertEqual(len(ids), 1000)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_new_conversation_ids_use_the_child_pid_after_fork(self) -> None:
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.write(write_end, new_conversation_id().encode("ascii"))
+            finally:
+                os._exit(0)
+        os.close(write_end)
+        with os.fdopen(read_end, "rb") as reader:
+            child_id = reader.read().decode("ascii")
+        os.waitpid(pid, 0)
+        self.assertEqual(child_id.split("-")[1], f"{pid:x}")
+        self.assertEqual(new_conversation_id().split("-")[1], f"{os.getpid():x}")
 
 
 if __name__ == "__main__":
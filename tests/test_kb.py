@@ -1,56 +1,160 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from neurohealth.kb import KnowledgeIndex
 
+from _fakes import FAKE_EMBEDDER, FakeEmbeddingClient
+
+_MODULE_TMP: Path
+
+
+class CountingEmbeddingClient(FakeEmbeddingClient):
+    def __init__(self) -> None:
+        self.embedded_texts = 0
 
-class FakeEmbeddingClient:
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
-        return [self._to_vector(text) for text in texts]
-
-    def embed_query(self, text: str) -> list[float]:
-        return self._to_vector(text)
-
-    @staticmethod
-    def _to_vector(text: str) -> list[float]:
-        lowered = text.lower()
-        return [
-            1.0 if "fever" in lowered else 0.0,
-            1.0 if "cough" in lowered else 0.0,
-            1.0,
-        ]
+        self.embedded_texts += len(texts)
+        return super().embed_texts(texts)
+
+
+def setUpModule() -> None:
+    global _MODULE_TMP
+    _MODULE_TMP = Path(tempfile.mkdtemp(prefix=f"neurohealth-kb-tests-{os.getpid()}-"))
+
+
+def tearDownModule() -> None:
+    shutil.rmtree(_MODULE_TMP, ignore_errors=True)
 
 
 class KnowledgeIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # One temp root per module; each test gets its own subdirectory of it.
+        self.base = Path(tempfile.mkdtemp(dir=_MODULE_TMP))
+
     def test_retrieval_prefers_relevant_chunk(self) -> None:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            kb_path = Path(temp_dir) / "kb.json"
-            kb = [
-                {
-                    "id": "f1",
-                    "title": "Fever guidance",
-                    "content": "High fever should be monitored carefully.",
-                    "source": "Source A",
-                    "tags": ["fever"],
-                },
-                {
-                    "id": "c1",
-                    "title": "Cough guidance",
-                    "content": "Mild cough can improve with rest.",
-                    "source": "Source B",
-                    "tags": ["cough"],
-                },
-            ]
-            kb_path.write_text(json.dumps(kb), encoding="utf-8")
-
-            embedder = FakeEmbeddingClient()
-            index = KnowledgeIndex.build(kb_path, embedder)
-            retrieved = index.retrieve("I have high fever", embedder, top_k=1)
-            self.assertEqual(retrieved[0].id, "f1")
+        kb_path = self.base / "kb.json"
+        kb = [
+            {
+                "id": "f1",
+                "title": "Fever guidance",
+                "content": "High fever should be monitored carefully.",
+                "source": "Source A",
+                "tags": ["fever"],
+            },
+            {
+                "id": "c1",
+                "title": "Cough guidance",
+                "content": "Mild cough can improve with rest.",
+                "source": "Source B",
+                "tags": ["cough"],
+            },
+        ]
+        kb_path.write_text(json.dumps(kb), encoding="utf-8")
+
+        index = KnowledgeIndex.build(kb_path, FAKE_EMBEDDER)
+        retrieved = index.retrieve("I have high fever", FAKE_EMBEDDER, top_k=1)
+        self.assertEqual(retrieved[0].id, "f1")
+        self.assertAlmostEqual(retrieved[0].score, 1.0, places=6)
+
+    def test_build_reuses_cached_embeddings(self) -> None:
+        kb_path = self.base / "kb.json"
+        cache_path = self.base / "kb_embeddings.json"
+        kb = [
+            {
+                "id": "f1",
+                "title": "Fever guidance",
+                "content": "High fever should be monitored carefully.",
+                "source": "Source A",
+            },
+            {
+                "id": "c1",
+                "title": "Cough guidance",
+                "content": "Mild cough can improve with rest.",
+                "source": "Source B",
+            },
+        ]
+        kb_path.write_text(json.dumps(kb), encoding="utf-8")
+
+        embedder = CountingEmbeddingClient()
+        first = KnowledgeIndex.build(kb_path, embedder, cache_path=cache_path, embedding_model="m")
+        self.assertEqual(embedder.embedded_texts, 2)
+        self.assertTrue(cache_path.exists())
+
+        second = KnowledgeIndex.build(kb_path, embedder, cache_path=cache_path, embedding_model="m")
+        self.assertEqual(embedder.embedded_texts, 2)
+        self.assertEqual(second.vectors, first.vectors)
+
+        kb[1]["content"] = "Persistent cough needs review."
+        kb_path.write_text(json.dumps(kb), encoding="utf-8")
+        KnowledgeIndex.build(kb_path, embedder, cache_path=cache_path, embedding_model="m")
+        self.assertEqual(embedder.embedded_texts, 3)
+
+    def test_duplicate_chunks_do_not_rewrite_the_cache(self) -> None:
+        kb_path = self.base / "kb.json"
+        chunk = {"id": "f1", "title": "Fever guidance", "content": "Rest.", "source": "Source A"}
+        kb_path.write_text(json.dumps([chunk, chunk]), encoding="utf-8")
+        cache_path = self.base / "cache.json"
+        KnowledgeIndex.build(kb_path, FAKE_EMBEDDER, cache_path=cache_path, embedding_model="m")
+        written = cache_path.stat().st_mtime_ns
+
+        with mock.patch("neurohealth.kb._save_embedding_cache") as save:
+            index = KnowledgeIndex.build(kb_path, FAKE_EMBEDDER, cache_path=cache_path, embedding_model="m")
+        save.assert_not_called()
+        self.assertEqual(len(index.vectors), 2)
+        self.assertEqual(cache_path.stat().st_mtime_ns, written)
+
+    def _write_kb(self) -> Path:
+        kb_path = self.base / "kb.json"
+        kb = [
+            {"id": "f1", "title": "Fever guidance", "content": "Rest.", "source": "Source A"},
+            {"id": "c1", "title": "Cough guidance", "content": "Fluids.", "source": "Source B"},
+        ]
+        kb_path.write_text(json.dumps(kb), encoding="utf-8")
+        return kb_path
+
+    def test_unwritable_cache_does_not_fail_build(self) -> None:
+        kb_path = self._write_kb()
+        blocker = self.base / "blocker"
+        blocker.write_text("not a directory", encoding="utf-8")
+        index = KnowledgeIndex.build(kb_path, FAKE_EMBEDDER, cache_path=blocker / "cache.json", embedding_model="m")
+        self.assertEqual(len(index.vectors), 2)
+
+        cache_path = self.base / "cache.json"
+        with mock.patch("neurohealth.kb.os.replace", side_effect=PermissionError("read-only")):
+            KnowledgeIndex.build(kb_path, FAKE_EMBEDDER, cache_path=cache_path, embedding_model="m")
+        self.assertEqual(list(self.base.glob("cache.json*")), [])
+
+    def test_corrupt_cache_is_re_embedded(self) -> None:
+        kb_path = self._write_kb()
+        cache_path = self.base / "cache.json"
+        KnowledgeIndex.build(kb_path, FAKE_EMBEDDER, cache_path=cache_path, embedding_model="m")
+        keys = list(json.loads(cache_path.read_bytes())["vectors"])
+
+        # name -> (cache file bytes, texts embedded on the next build)
+        corrupt_payloads = {
+            "invalid json": (b"{not json", 2),
+            "wrong root": (b"[1, 2]", 2),
+            "legacy layout": (json.dumps({key: [1.0, 0.0, 0.0, 1.0] for key in keys}).encode(), 2),
+            "non-numeric": (json.dumps({"dimension": 4, "vectors": {key: ["1", "0", "0", "1"] for key in keys}}).encode(), 2),
+            "wrong dimension": (json.dumps({"dimension": 4, "vectors": {key: [1.0, 0.0] for key in keys}}).encode(), 2),
+            # The hit disagrees with the fresh vector's dimension, so both are redone.
+            "stale dimension": (json.dumps({"dimension": 2, "vectors": {keys[0]: [1.0, 0.0]}}).encode(), 1 + 2),
+        }
+        for name, (payload, expected_embedded) in corrupt_payloads.items():
+            with self.subTest(name=name):
+                cache_path.write_bytes(payload)
+                embedder = CountingEmbeddingClient()
+                index = KnowledgeIndex.build(kb_path, embedder, cache_path=cache_path, embedding_model="m")
+                self.assertEqual(embedder.embedded_texts, expected_embedded)
+                self.assertEqual({len(vector) for vector in index.vectors}, {4})
+                self.assertEqual(json.loads(cache_path.read_bytes())["dimension"], 4)
 
 
 if __name__ == "__main__":
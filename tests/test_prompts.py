@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+import unittest
+
+from neurohealth.models import (
+    ConversationTurn,
+    NeuroHealthRequest,
+    RetrievedChunk,
+    SymptomReport,
+    UserProfile,
+)
+from neurohealth.prompts import build_reasoning_prompt
+
+
+class ReasoningPromptTests(unittest.TestCase):
+    def _build(self, request: NeuroHealthRequest) -> str:
+        return build_reasoning_prompt(
+            request=request,
+            retrieved_chunks=[
+                RetrievedChunk(id="f1", title="Fever guidance", content="Rest.", source="Source A", score=0.9)
+            ],
+            urgency="routine",
+            appointment_recommendation="Schedule a primary care appointment within 2-7 days.",
+            safety_instructions=("Track symptoms.", "Escalate if worse."),
+            clarifying_questions=[],
+        )
+
+    def test_prompt_layout(self) -> None:
+        request = NeuroHealthRequest(
+            user_input="I have a mild fever",
+            user_profile=UserProfile(age=30, preferences=["vegetarian"]),
+            symptom_report=SymptomReport(symptoms=["mild fever"], pain_level=2),
+            history=[
+                ConversationTurn(role="user", content="Hello"),
+                ConversationTurn(role="assistant", content='Say "hi"\nback'),
+            ],
+        )
+        prompt = self._build(request)
+
+        self.assertFalse(prompt.startswith("\n"))
+        self.assertFalse(prompt.endswith("\n"))
+        self.assertTrue(prompt.startswith("User profile:\n{\n"))
+        self.assertTrue(prompt.endswith("5) Optional clarifying questions (only if truly needed)"))
+        self.assertIn(
+            "Conversation history:\n"
+            + json.dumps([{"role": "user", "content": "Hello"}, {"role": "assistant", "content": 'Say "hi"\nback'}], indent=2)
+            + "\n\nLatest user message:\nI have a mild fever\n",
+            prompt,
+        )
+        self.assertIn(
+            "Symptom report:\n"
+            + json.dumps({"symptoms": ["mild fever"], "biometrics": {}, "duration_hours": None, "pain_level": 2}, indent=2),
+            prompt,
+        )
+        self.assertIn("- [Source A] Fever guidance: Rest.\n", prompt)
+        self.assertIn("Safety instructions to include:\n- Track symptoms.\n- Escalate if worse.\n", prompt)
+        self.assertIn("Clarifying questions to ask if needed:\n- None\n", prompt)
+
+    def test_empty_history_renders_empty_array(self) -> None:
+        prompt = self._build(NeuroHealthRequest(user_input="I have a mild fever"))
+        self.assertIn("Conversation history:\n[]\n", prompt)
+
+
+if __name__ == "__main__":
+    unittest.main()
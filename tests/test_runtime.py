@@ -22,9 +22,24 @@ class RuntimeParsingTests(unittest.TestCase):
         self.assertEqual(parsed["heart_rate"], 89)
         self.assertEqual(parsed["note"], "slight cough")
 
+    def test_parse_biometrics_value_forms(self) -> None:
+        parsed = parse_biometrics([" heart_rate = 89 ", "delta=-3", "dose=1.5e2", "ratio=.5", "code=1e3", "note= a b "])
+        self.assertEqual(
+            parsed,
+            {"heart_rate": 89, "delta": -3, "dose": 150.0, "ratio": 0.5, "code": "1e3", "note": "a b"},
+        )
+        self.assertIsInstance(parsed["heart_rate"], int)
+
+    def test_parse_biometrics_scale(self) -> None:
+        items = [f"metric_{index}={'3.14' if index % 2 else index}" for index in range(1000)]
+        parsed = parse_biometrics(items)
+        self.assertEqual(parsed, {f"metric_{index}": 3.14 if index % 2 else index for index in range(1000)})
+        self.assertTrue(all(type(parsed[f"metric_{index}"]) is (float if index % 2 else int) for index in range(1000)))
+
     def test_parse_biometrics_rejects_invalid(self) -> None:
-        with self.assertRaises(ValueError):
-            parse_biometrics(["invalid"])
+        for item in ("invalid", "=5", " = 5", "heart_rate=", "heart_rate=  "):
+            with self.subTest(item=item), self.assertRaises(ValueError):
+                parse_biometrics([item])
 
 
 if __name__ == "__main__":
@@ -1,31 +1,65 @@
 from __future__ import annotations
 
 import unittest
+from dataclasses import asdict
 
-from neurohealth.models import SymptomReport
+from neurohealth.models import SymptomReport, UrgencyLevel
 from neurohealth.safety import (
+    EMERGENCY_KEYWORDS,
     appointment_for_urgency,
     assess_urgency,
     build_clarifying_questions,
 )
 
+# (report, user input, expected urgency, trigger that must be reported)
+URGENCY_CASES: list[tuple[SymptomReport, str, UrgencyLevel, str]] = [
+    (
+        SymptomReport(symptoms=["chest pain", "shortness of breath"], pain_level=8),
+        "I have chest pain and feel breathless",
+        "emergency",
+        "keyword:chest pain",
+    ),
+    (
+        SymptomReport(symptoms=["fever"], biometrics={"temperature_c": 39.2}, pain_level=4),
+        "My fever is high",
+        "urgent",
+        "biometric:high_fever",
+    ),
+    (
+        SymptomReport(symptoms=["mild cough"], pain_level=2),
+        "I have mild cough for one day",
+        "routine",
+        "symptoms_present",
+    ),
+]
+
 
 class SafetyTests(unittest.TestCase):
-    def test_emergency_for_chest_pain(self) -> None:
-        report = SymptomReport(symptoms=["chest pain", "shortness of breath"], pain_level=8)
-        urgency, triggers = assess_urgency(report, "I have chest pain and feel breathless")
+    def test_assess_urgency_table(self) -> None:
+        for report, user_input, expected_urgency, expected_trigger in URGENCY_CASES:
+            with self.subTest(user_input=user_input):
+                urgency, triggers = assess_urgency(report, user_input)
+                self.assertEqual(urgency, expected_urgency)
+                self.assertIn(expected_trigger, triggers)
+
+    def test_emergency_triggers_are_unique_and_complete(self) -> None:
+        report = SymptomReport(symptoms=["Chest pain"])
+        urgency, triggers = assess_urgency(report, "chest   pain since this morning, now high fever")
         self.assertEqual(urgency, "emergency")
-        self.assertTrue(any("keyword:chest pain" == trigger for trigger in triggers))
+        self.assertEqual(triggers, ("keyword:chest pain",))
+
+        message = " and ".join(reversed(EMERGENCY_KEYWORDS))
+        _, triggers = assess_urgency(SymptomReport(), message)
+        self.assertEqual(triggers, tuple(f"keyword:{keyword}" for keyword in reversed(EMERGENCY_KEYWORDS)))
 
-    def test_urgent_for_high_fever(self) -> None:
-        report = SymptomReport(symptoms=["fever"], biometrics={"temperature_c": 39.2}, pain_level=4)
-        urgency, _ = assess_urgency(report, "My fever is high")
-        self.assertEqual(urgency, "urgent")
+    def test_symptoms_added_after_construction_are_assessed(self) -> None:
+        report = SymptomReport(symptoms=["mild cough"])
+        report.symptoms.append("chest pain")
+        self.assertEqual(assess_urgency(report, "I feel unwell"), ("emergency", ("keyword:chest pain",)))
 
-    def test_routine_when_symptoms_present_without_red_flags(self) -> None:
-        report = SymptomReport(symptoms=["mild cough"], pain_level=2)
-        urgency, _ = assess_urgency(report, "I have mild cough for one day")
-        self.assertEqual(urgency, "routine")
+        report.symptoms = ["infection"]
+        self.assertEqual(assess_urgency(report, "I feel unwell")[0], "urgent")
+        self.assertEqual(SymptomReport(**asdict(report)), report)
 
     def test_appointment_mapping(self) -> None:
         self.assertIn("emergency", appointment_for_urgency("emergency").lower())
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from neurohealth.transport import _connections, post_bytes
+
+_PAYLOAD = b'{"ok": true}'
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _RecordingServer
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", "0")))
+        self.server.seen.append((self.client_address[1], self.path, self.headers.get("User-Agent"), body))
+        if self.server.drop_before_response:
+            # The request was received (and possibly acted on) but the response
+            # never arrives.
+            self.close_connection = True
+            return
+        self.send_response(self.server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(_PAYLOAD)
+        if self.server.drop_after_response:
+            # Close without a Connection: close header, like a server reaping an
+            # idle keep-alive socket the client still considers open.
+            self.close_connection = True
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+class _RecordingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _RecordingHandler)
+        self.seen: list[tuple[int, str, str | None, bytes]] = []
+        self.status = 200
+        self.drop_after_response = False
+        self.drop_before_response = False
+        self.closed = threading.Event()
+
+    def shutdown_request(self, request: object) -> None:
+        super().shutdown_request(request)
+        self.closed.set()
+
+
+class PostBytesTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = _RecordingServer()
+        threading.Thread(target=cls.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/v1/embeddings"
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        # Proxy variables from the host would route these requests elsewhere.
+        environment = mock.patch.dict(os.environ, {}, clear=True)
+        environment.start()
+        self.addCleanup(environment.stop)
+        self.addCleanup(self._close_pooled_connections)
+        self.server.seen.clear()
+        self.server.status = 200
+        self.server.drop_after_response = False
+        self.server.drop_before_response = False
+        self.server.closed.clear()
+
+    @staticmethod
+    def _close_pooled_connections() -> None:
+        pool = _connections()
+        for connection in pool.values():
+            connection.close()
+        pool.clear()
+
+    def _post(self, url: str | None = None, headers: dict[str, str] | None = None) -> tuple[int, bytes]:
+        return post_bytes(url or self.url, headers or {}, b'{"input": "fever"}', timeout=5)
+
+    def test_connection_is_reused(self) -> None:
+        self.assertEqual(self._post(), (200, _PAYLOAD))
+        self.assertEqual(self._post(), (200, _PAYLOAD))
+        ports = {port for port, _, _, _ in self.server.seen}
+        self.assertEqual(len(ports), 1)
+        _, path, user_agent, body = self.server.seen[0]
+        self.assertEqual((path, body), ("/v1/embeddings", b'{"input": "fever"}'))
+        self.assertTrue(user_agent.startswith("neurohealth "))
+
+    def test_caller_user_agent_is_kept(self) -> None:
+        self._post(headers={"user-agent": "custom-agent"})
+        self.assertEqual(self.server.seen[0][2], "custom-agent")
+
+    def test_reconnects_after_server_closes_kept_alive_socket(self) -> None:
+        self.server.drop_after_response = True
+        self.assertEqual(self._post(), (200, _PAYLOAD))
+        self.assertTrue(self.server.closed.wait(5))
+        self.assertEqual(self._post(), (200, _PAYLOAD))
+        self.assertEqual(len(self.server.seen), 2)
+        self.assertNotEqual(self.server.seen[0][0], self.server.seen[1][0])
+
+    def test_request_is_not_replayed_after_it_was_sent(self) -> None:
+        self.assertEqual(self._post(), (200, _PAYLOAD))
+        self.server.drop_before_response = True
+        with self.assertRaises(ConnectionError):
+            self._post()
+        self.assertEqual(len(self.server.seen), 2)
+        self.assertEqual(self.server.seen[0][0], self.server.seen[1][0])
+        self.assertEqual(_connections(), {})
+
+    def test_error_status_is_returned_and_connection_kept(self) -> None:
+        self.server.status = 503
+        self.assertEqual(self._post(), (503, _PAYLOAD))
+        self.server.status = 200
+        self.assertEqual(self._post(), (200, _PAYLOAD))
+        self.assertEqual(self.server.seen[0][0], self.server.seen[1][0])
+
+    def test_proxy_environment_falls_back_to_urllib(self) -> None:
+        proxy = f"http://127.0.0.1:{self.server.server_address[1]}"
+        target = "http://api.example.test/v1/embeddings"
+        with mock.patch.dict(os.environ, {"http_proxy": proxy}):
+            self.assertEqual(self._post(target), (200, _PAYLOAD))
+            self.server.status = 503
+            self.assertEqual(self._post(target), (503, _PAYLOAD))
+        # A proxied request carries the absolute target URL as its path.
+        self.assertEqual([path for _, path, _, _ in self.server.seen], [target, target])
+        self.assertTrue(self.server.seen[0][2].startswith("neurohealth "))
+        self.assertEqual(_connections(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
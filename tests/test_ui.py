@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import http.client
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+from neurohealth.embeddings import GitHubModelsEmbeddingClient
+from neurohealth.engine import NeuroHealthEngine
+from neurohealth.feedback import FeedbackStore
+from neurohealth.kb import KnowledgeIndex
+from neurohealth.models import KnowledgeChunk, NeuroHealthRequest, SymptomReport
+from neurohealth.ui import DIAGRAM_PATH, _create_handler, _QueryEmbeddingBatcher
+
+from _fakes import FakeEmbeddingClient
+
+_MODULE_TMP: Path
+
+
+def setUpModule() -> None:
+    global _MODULE_TMP
+    _MODULE_TMP = Path(tempfile.mkdtemp(prefix=f"neurohealth-ui-tests-{os.getpid()}-"))
+
+
+def tearDownModule() -> None:
+    shutil.rmtree(_MODULE_TMP, ignore_errors=True)
+
+
+class GatedLLMClient:
+    # Prompts mentioning "slow" block until the gate opens.
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.call_count = 0
+
+    def generate(self, prompt: str, system_instruction: str | None = None) -> str:
+        self.call_count += 1
+        if "slow" in prompt:
+            self.gate.wait(5)
+        return "Rest and hydrate."
+
+
+class FlakyEmbeddingClient(FakeEmbeddingClient):
+    # Any request containing a "bad" query fails as a whole.
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        if any("bad" in text for text in texts):
+            raise ValueError("embedding rejected")
+        return super().embed_texts(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_texts([text])[0]
+
+
+class QueryEmbeddingBatcherTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.llm_client = GatedLLMClient()
+        self.addCleanup(self.llm_client.gate.set)
+        self.feedback_store = FeedbackStore(Path(tempfile.mkdtemp(dir=_MODULE_TMP)) / "feedback.jsonl")
+        self.addCleanup(self.feedback_store.close)
+
+    def _engine(self, embedding_client: FakeEmbeddingClient) -> NeuroHealthEngine:
+        return NeuroHealthEngine(
+            knowledge_index=KnowledgeIndex(
+                chunks=[KnowledgeChunk(id="f1", title="Fever", content="Rest.", source="Source A")],
+                vectors=[[1.0, 0.0, 0.0, 1.0]],
+            ),
+            embedding_client=embedding_client,
+            llm_client=self.llm_client,
+            feedback_store=self.feedback_store,
+        )
+
+    def test_slow_completion_does_not_delay_other_requests(self) -> None:
+        engine = self._engine(FakeEmbeddingClient())
+        batcher = _QueryEmbeddingBatcher(engine.embedding_client)
+        slow = threading.Thread(
+            target=engine.generate,
+            args=(NeuroHealthRequest(user_input="slow fever question"),),
+            kwargs={"embedding_client": batcher},
+        )
+        slow.start()
+        # Cleanups run last-in first-out: open the gate, then join.
+        self.addCleanup(slow.join)
+        self.addCleanup(self.llm_client.gate.set)
+        while self.llm_client.call_count == 0:
+            time.sleep(0.001)
+
+        emergency = engine.generate(
+            NeuroHealthRequest(user_input="I have chest pain", symptom_report=SymptomReport(symptoms=["chest pain"])),
+            embedding_client=batcher,
+        )
+        routine = engine.generate(NeuroHealthRequest(user_input="I have mild fever"), embedding_client=batcher)
+
+        # Both finished while the slow completion was still held at the gate, and
+        # the emergency made no LLM call of its own.
+        self.assertFalse(self.llm_client.gate.is_set())
+        self.assertTrue(slow.is_alive())
+        self.assertTrue(emergency.needs_emergency)
+        self.assertEqual(routine.assistant_message, "Rest and hydrate.")
+        self.assertEqual(self.llm_client.call_count, 2)
+
+    def test_failed_query_fails_alone(self) -> None:
+        embedding_client = FlakyEmbeddingClient()
+        engine = self._engine(embedding_client)
+        batcher = _QueryEmbeddingBatcher(embedding_client, max_batch_size=2, max_batch_delay=5.0)
+        outcomes: dict[str, object] = {}
+
+        def submit(query: str) -> None:
+            try:
+                outcomes[query] = engine.generate(NeuroHealthRequest(user_input=query), embedding_client=batcher)
+            except ValueError as exc:
+                outcomes[query] = exc
+
+        threads = [threading.Thread(target=submit, args=(query,)) for query in ("mild fever", "bad cough")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertIsInstance(outcomes["bad cough"], ValueError)
+        self.assertEqual(outcomes["mild fever"].assistant_message, "Rest and hydrate.")
+        self.assertEqual(self.llm_client.call_count, 1)
+        self.assertEqual(sorted(map(sorted, embedding_client.calls)), [["bad cough"], ["bad cough", "mild fever"], ["mild fever"]])
+
+    def test_repeated_query_is_served_from_the_client_cache(self) -> None:
+        posted: list[object] = []
+
+        def post_json(url: str, headers: dict[str, str], payload: dict[str, object]) -> dict[str, object]:
+            posted.append(payload["input"])
+            return {"data": [{"index": 0, "embedding": [1.0, 0.0]}]}
+
+        batcher = _QueryEmbeddingBatcher(GitHubModelsEmbeddingClient(api_key="token", post_json=post_json))
+        vectors = [batcher.embed_query("I have high fever") for _ in range(3)]
+        self.assertEqual(vectors, [[1.0, 0.0]] * 3)
+        self.assertEqual(posted, [["I have high fever"]])
+
+    def test_stuck_batch_times_out(self) -> None:
+        released = threading.Event()
+        self.addCleanup(released.set)
+
+        class StuckEmbeddingClient(FakeEmbeddingClient):
+            def embed_queries(self, texts: list[str]) -> list[list[float]]:
+                released.wait(5)
+                return super().embed_queries(texts)
+
+        batcher = _QueryEmbeddingBatcher(StuckEmbeddingClient(), result_timeout=0.05)
+        with self.assertRaises(TimeoutError):
+            batcher.embed_query("I have mild fever")
+
+
+@unittest.skipUnless(DIAGRAM_PATH.exists(), "diagram asset not present")
+class DiagramTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _create_handler(lambda: None))
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.expected = DIAGRAM_PATH.read_bytes()
+
+    def _download(self, bodies: list[bytes], count: int) -> None:
+        connection = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1], timeout=10)
+        try:
+            for _ in range(count):
+                connection.request("GET", "/diagram.png")
+                bodies.append(connection.getresponse().read())
+        finally:
+            connection.close()
+
+    def test_concurrent_downloads_share_the_handle_safely(self) -> None:
+        bodies: list[bytes] = []
+        threads = [threading.Thread(target=self._download, args=(bodies, 5)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(bodies), 40)
+        self.assertTrue(all(body == self.expected for body in bodies))
+
+    def test_partial_and_blocked_sends_resume_at_the_right_offset(self) -> None:
+        real_sendfile = os.sendfile
+        calls: list[int] = []
+
+        def short_sendfile(out_fd: int, in_fd: int, offset: int, count: int) -> int:
+            calls.append(offset)
+            if len(calls) == 1:
+                raise BlockingIOError
+            return real_sendfile(out_fd, in_fd, offset, min(count, 1000))
+
+        bodies: list[bytes] = []
+        with mock.patch("neurohealth.ui.os.sendfile", side_effect=short_sendfile):
+            self._download(bodies, 1)
+
+        self.assertEqual(bodies, [self.expected])
+        self.assertEqual(calls[:3], [0, 0, 1000])
+
+
+if __name__ == "__main__":
+    unittest.main()